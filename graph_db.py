@@ -76,6 +76,31 @@ class GraphDB:
         
         return True
     
+    def add_nodes_bulk(self, nodes: List[Tuple[str, Optional[Dict[str, Any]]]]) -> int:
+        """
+        Add many nodes, updating the node count once
+        
+        Args:
+            nodes: (node_id, data) pairs
+            
+        Returns:
+            Number of nodes added (existing ids are skipped)
+        """
+        added = 0
+        for node_id, data in nodes:
+            key = f"node:{node_id}"
+            if self.db.exists(key):
+                continue
+            self.db.set(key, json.dumps(data or {}))
+            self.db.set(f"adj:{node_id}", "[]")
+            added += 1
+        
+        if added:
+            count = int(self.db.get("__meta__:node_count") or "0")
+            self.db.set("__meta__:node_count", str(count + added))
+        
+        return added
+    
     def delete_node(self, node_id: str) -> bool:
         """
         Delete a node and all its edges
@@ -236,6 +261,62 @@ class GraphDB:
         
         return True
     
+    def add_edges_bulk(self, edges: List[Tuple[str, str, float, str]]) -> int:
+        """
+        Add many edges, writing each touched adjacency list once
+        
+        Args:
+            edges: (from_node, to_node, weight, label) tuples
+            
+        Returns:
+            Number of edges added (edges with a missing endpoint are skipped)
+        """
+        adjacency: Dict[str, List[Dict[str, Any]]] = {}
+        exists: Dict[str, bool] = {}
+        added = 0
+        
+        def link(from_node: str, to_node: str, weight: float, edge_json: str):
+            self.db.set(f"edge:{from_node}:{to_node}", edge_json)
+            if from_node not in adjacency:
+                adjacency[from_node] = json.loads(self.db.get(f"adj:{from_node}") or "[]")
+            
+            edge_info = {"to": to_node}
+            if self.weighted:
+                edge_info["weight"] = weight
+            
+            # Remove existing edge to same node (if updating)
+            adj_list = [e for e in adjacency[from_node] if e.get('to') != to_node]
+            adj_list.append(edge_info)
+            adjacency[from_node] = adj_list
+        
+        for from_node, to_node, weight, label in edges:
+            for node_id in (from_node, to_node):
+                if node_id not in exists:
+                    exists[node_id] = self.node_exists(node_id)
+            if not (exists[from_node] and exists[to_node]):
+                continue
+            
+            edge_data = {}
+            if self.weighted:
+                edge_data["weight"] = weight
+            if label:
+                edge_data["label"] = label
+            edge_json = json.dumps(edge_data)
+            
+            link(from_node, to_node, weight, edge_json)
+            if not self.directed:
+                link(to_node, from_node, weight, edge_json)
+            added += 1
+        
+        for node_id, adj_list in adjacency.items():
+            self.db.set(f"adj:{node_id}", json.dumps(adj_list))
+        
+        if added:
+            count = int(self.db.get("__meta__:edge_count") or "0")
+            self.db.set("__meta__:edge_count", str(count + added))
+        
+        return added
+    
     def delete_edge(self, from_node: str, to_node: str) -> bool:
         """
         Delete an edge
@@ -0,0 +1,35 @@
+"""
+Gunicorn configuration for the Ontology Editor API
+
+Usage:
+    gunicorn -c gunicorn.conf.py ontology_api:app
+"""
+
+import os
+
+bind = os.getenv("ONTOLOGY_API_BIND", "0.0.0.0:5002")
+
+# The ontology lives in process memory (SimpleDB), so every worker process
+# holds its own independent copy and writes are not shared between them.
+# Scale with threads inside one process; raise WEB_CONCURRENCY only for
+# read-only deployments.
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+worker_class = "gthread"
+threads = int(os.getenv("ONTOLOGY_API_THREADS", "8"))
+
+# Keep connections from nginx open between requests
+keepalive = 5
+timeout = 60
+
+# The service is built per worker (see post_worker_init), never in the
+# master before it forks
+preload_app = False
+
+accesslog = "-"
+errorlog = "-"
+
+
+def post_worker_init(worker):
+    """Build the ontology service in the background once the worker has loaded the app"""
+    from ontology_api import start_warmup
+    start_warmup()
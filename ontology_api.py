@@ -6,11 +6,19 @@ Flask REST API for the ontology editor application.
 Provides endpoints for class, property, and instance management.
 """
 
-from flask import Flask, jsonify, request, send_from_directory
+from flask import Flask, Response, request, send_from_directory
 from flask_cors import CORS
 import logging
+import orjson
+import threading
+import time
+import uuid
 from datetime import datetime
-from typing import Dict, Any
+from functools import wraps
+from operator import attrgetter
+from itertools import islice
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Iterator, List, Tuple
 from src.services.ontology_service import OntologyService
 from src.services.graph_pagination_service import GraphPaginationService
 from src.services.ontology_models import (
@@ -18,7 +26,8 @@ from src.services.ontology_models import (
     OntologyProperty,
     OntologyInstance,
     PropertyType,
-    PropertyCharacteristic,
+    PROPERTY_TYPES_BY_VALUE,
+    PROPERTY_CHARACTERISTICS_BY_VALUE,
 )
 from src.services.base_service import (
     NodeNotFoundError,
@@ -41,6 +50,19 @@ CORS(app)
 ontology_service = None
 pagination_service = None
 
+# Guards lazy initialization when requests arrive concurrently on worker threads
+_service_lock = threading.Lock()
+
+# Serialized bodies of read-mostly endpoints, keyed by (path, args the
+# endpoint reads, version). Every successful write bumps the version and
+# clears the cache; between writes the oldest entries go first once full.
+_resp_cache: 'OrderedDict[Tuple, bytes]' = OrderedDict()
+_RESP_CACHE_MAX_ENTRIES = 1024
+_ontology_version = 0
+
+# Makes ETags from different processes or restarts distinct at equal versions
+_BOOT_ID = uuid.uuid4().hex[:12]
+
 def init_demo_data(service):
     """Initialize demo data if ontology is empty"""
     from src.services.ontology_models import (
@@ -49,7 +71,7 @@ def init_demo_data(service):
     )
     
     # Check if already initialized (more than just owl:Thing)
-    if len(service.get_all_classes()) > 1:
+    if len(service.get_all_classes(limit=2)) > 1:
         logger.info("Demo data already exists, skipping initialization")
         return
     
@@ -138,10 +160,13 @@ def get_ontology_service():
     """Get or create ontology service instance"""
     global ontology_service
     if ontology_service is None:
-        logger.info("Initializing ontology service...")
-        ontology_service = OntologyService()
-        logger.info("Ontology service initialized successfully")
-        init_demo_data(ontology_service)
+        with _service_lock:
+            if ontology_service is None:
+                logger.info("Initializing ontology service...")
+                service = OntologyService()
+                logger.info("Ontology service initialized successfully")
+                init_demo_data(service)
+                ontology_service = service
     return ontology_service
 
 
@@ -149,9 +174,12 @@ def get_pagination_service():
     """Get or create pagination service instance"""
     global pagination_service
     if pagination_service is None:
-        logger.info("Initializing pagination service...")
-        pagination_service = GraphPaginationService(get_ontology_service().graph)
-        logger.info("Pagination service initialized successfully")
+        graph = get_ontology_service().graph
+        with _service_lock:
+            if pagination_service is None:
+                logger.info("Initializing pagination service...")
+                pagination_service = GraphPaginationService(graph)
+                logger.info("Pagination service initialized successfully")
     return pagination_service
 
 
@@ -159,23 +187,172 @@ def get_pagination_service():
 # Helper Functions
 # ============================================================================
 
+def _json(data: Any, status: int = 200) -> Response:
+    """Serialize data with orjson into a JSON response"""
+    return Response(
+        orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+# Formatted timestamp and the monotonic time it was taken at
+_ts_cache = ["", float("-inf")]
+_TS_TTL = 0.1
+
+
+def _now_iso() -> str:
+    """Current UTC time in ISO format, reformatted at most every 100ms"""
+    now = time.monotonic()
+    if now - _ts_cache[1] > _TS_TTL:
+        _ts_cache[:] = [datetime.utcnow().isoformat(), now]
+    return _ts_cache[0]
+
+
+# Field specs for list endpoints: (output keys, C-level getter for those attributes)
+_CLASS_BRIEF_ROW = ('id', 'label', 'description')
+_PROPERTY_ROW = ('id', 'label', 'property_type', 'description', 'domain', 'range')
+_INSTANCE_ROW = ('id', 'label', 'class_ids')
+_ROW_GETTERS = {fields: attrgetter(*fields) for fields in
+                (_CLASS_BRIEF_ROW, _PROPERTY_ROW, _INSTANCE_ROW)}
+
+
+def _rows(items: Iterable[Any], fields: Tuple[str, ...]) -> List[Dict]:
+    """Project model objects onto dicts of the given attribute names"""
+    return [dict(zip(fields, row)) for row in map(_ROW_GETTERS[fields], items)]
+
+
+# Rows encoded per chunk when streaming list responses
+_STREAM_CHUNK_ROWS = 256
+
+
+def _stream_list(items: Iterable[Any], fields: Tuple[str, ...],
+                 message: str = "Success") -> Iterator[bytes]:
+    """Yield a success_response-shaped JSON body for a list, chunk by chunk"""
+    getter = _ROW_GETTERS[fields]
+    rows = (orjson.dumps(dict(zip(fields, row))) for row in map(getter, items))
+    
+    yield b'{"success":true,"message":' + orjson.dumps(message) + b',"data":['
+    sep = b''
+    while True:
+        chunk = list(islice(rows, _STREAM_CHUNK_ROWS))
+        if not chunk:
+            break
+        yield sep + b','.join(chunk)
+        sep = b','
+    yield b'],"timestamp":' + orjson.dumps(_now_iso()) + b'}'
+
+
+def _stream_json(items: Iterable[Any], fields: Tuple[str, ...]) -> Response:
+    """
+    Stream model objects as a JSON success response
+    
+    items is consumed chunk by chunk as the body is sent; pass a service
+    iterator (iter_subclasses etc.) so only one chunk of objects is held.
+    """
+    return Response(_stream_list(items, fields), mimetype='application/json')
+
+
 def success_response(data: Any, message: str = "Success") -> Dict:
     """Create success response"""
     return {
         "success": True,
         "message": message,
         "data": data,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _now_iso()
     }
 
 
-def error_response(error: str, status_code: int = 400) -> tuple:
+# Pre-serialized frames for payloads without data; only the values are encoded
+_ERROR_TEMPLATE = b'{"success":false,"error":%b,"timestamp":%b}'
+_MESSAGE_TEMPLATE = b'{"success":true,"message":%b,"data":null,"timestamp":%b}'
+
+
+def error_response(error: str, status_code: int = 400) -> Response:
     """Create error response"""
-    return jsonify({
-        "success": False,
-        "error": error,
-        "timestamp": datetime.utcnow().isoformat()
-    }), status_code
+    body = _ERROR_TEMPLATE % (orjson.dumps(error), orjson.dumps(_now_iso()))
+    return Response(body, status=status_code, mimetype='application/json')
+
+
+def message_response(message: str) -> Response:
+    """Create success response that carries no data"""
+    body = _MESSAGE_TEMPLATE % (orjson.dumps(message), orjson.dumps(_now_iso()))
+    return Response(body, mimetype='application/json')
+
+
+def cached_response(*arg_names: str):
+    """
+    Serve a read endpoint from the response cache, filling it on a miss
+    
+    Responses carry a weak ETag derived from the ontology version, and a
+    matching If-None-Match is answered with 304 without touching the cache.
+    Both carry the same Cache-Control.
+    
+    Args:
+        arg_names: Query arguments the endpoint reads; only these are part
+            of the cache key, so unrelated query strings share one entry
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            version = _ontology_version
+            etag = f"{_BOOT_ID}-{version}"
+            if request.if_none_match.contains_weak(etag):
+                response = Response(status=304)
+            else:
+                key = (request.path, tuple(request.args.get(name) for name in arg_names), version)
+                cached = _resp_cache.get(key)
+                if cached is not None:
+                    response = Response(cached, mimetype='application/json')
+                else:
+                    response = app.make_response(view(*args, **kwargs))
+                    if response.status_code != 200:
+                        return response
+                    _store_response(key, response.get_data())
+            
+            # A 304 repeats the validators and caching policy of the 200
+            response.set_etag(etag, weak=True)
+            response.headers['Cache-Control'] = 'private, max-age=0, must-revalidate'
+            return response
+        return wrapper
+    return decorator
+
+
+def _store_response(key: Tuple, body: bytes):
+    """Add a body to the response cache, evicting the oldest entries when full"""
+    _resp_cache[key] = body
+    while len(_resp_cache) > _RESP_CACHE_MAX_ENTRIES:
+        try:
+            _resp_cache.popitem(last=False)
+        except KeyError:
+            # Emptied by a concurrent invalidate_response_cache()
+            break
+
+
+def invalidate_response_cache():
+    """Drop cached read responses after an ontology mutation"""
+    global _ontology_version
+    _ontology_version += 1
+    _resp_cache.clear()
+
+
+def _load_json() -> Any:
+    """
+    Parse the request body with orjson
+    
+    Returns:
+        Parsed JSON value, or None if the body is empty
+        
+    Raises:
+        ValidationError: If the body is not valid JSON
+    """
+    body = request.get_data(cache=False)
+    if not body:
+        return None
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        raise ValidationError(f"Invalid JSON body: {e}")
 
 
 # ============================================================================
@@ -183,18 +360,13 @@ def error_response(error: str, status_code: int = 400) -> tuple:
 # ============================================================================
 
 @app.route('/api/ontology/classes', methods=['GET'])
+@cached_response()
 def get_classes():
     """Get all ontology classes"""
     try:
-        classes = get_ontology_service().get_all_classes()
-        return jsonify(success_response([
-            {
-                "id": c.id,
-                "label": c.label,
-                "description": c.description,
-                "parent_classes": c.parent_classes,
-                "is_abstract": c.is_abstract
-            } for c in classes
+        columns = get_ontology_service().get_all_classes_columnar()
+        return _json(success_response([
+            dict(zip(columns, row)) for row in zip(*columns.values())
         ]))
     except Exception as e:
         logger.error(f"Error getting classes: {e}", exc_info=True)
@@ -206,7 +378,7 @@ def get_class(class_id: str):
     """Get specific class"""
     try:
         class_obj = get_ontology_service().get_class(class_id)
-        return jsonify(success_response({
+        return _json(success_response({
             "id": class_obj.id,
             "label": class_obj.label,
             "description": class_obj.description,
@@ -226,7 +398,7 @@ def get_class(class_id: str):
 def create_class():
     """Create new class"""
     try:
-        data = request.get_json()
+        data = _load_json()
         
         class_obj = OntologyClass(
             id=data['id'],
@@ -239,8 +411,9 @@ def create_class():
         )
         
         created = get_ontology_service().create_class(class_obj)
+        invalidate_response_cache()
         
-        return jsonify(success_response({
+        return _json(success_response({
             "id": created.id,
             "label": created.label,
             "description": created.description,
@@ -260,7 +433,8 @@ def delete_class(class_id: str):
     try:
         force = request.args.get('force', 'false').lower() == 'true'
         get_ontology_service().delete_class(class_id, force=force)
-        return jsonify(success_response(None, f"Class '{class_id}' deleted"))
+        invalidate_response_cache()
+        return message_response(f"Class '{class_id}' deleted")
     except (NodeNotFoundError, InvalidOperationError) as e:
         return error_response(str(e), 400)
     except Exception as e:
@@ -273,11 +447,8 @@ def get_subclasses(class_id: str):
     """Get subclasses of a class"""
     try:
         direct_only = request.args.get('direct', 'false').lower() == 'true'
-        subclasses = get_ontology_service().get_subclasses(class_id, direct_only=direct_only)
-        return jsonify(success_response([
-            {"id": c.id, "label": c.label, "description": c.description}
-            for c in subclasses
-        ]))
+        subclasses = get_ontology_service().iter_subclasses(class_id, direct_only=direct_only)
+        return _stream_json(subclasses, _CLASS_BRIEF_ROW)
     except Exception as e:
         logger.error(f"Error getting subclasses: {e}", exc_info=True)
         return error_response(str(e), 500)
@@ -288,22 +459,20 @@ def get_superclasses(class_id: str):
     """Get superclasses of a class"""
     try:
         direct_only = request.args.get('direct', 'false').lower() == 'true'
-        superclasses = get_ontology_service().get_superclasses(class_id, direct_only=direct_only)
-        return jsonify(success_response([
-            {"id": c.id, "label": c.label, "description": c.description}
-            for c in superclasses
-        ]))
+        superclasses = get_ontology_service().iter_superclasses(class_id, direct_only=direct_only)
+        return _stream_json(superclasses, _CLASS_BRIEF_ROW)
     except Exception as e:
         logger.error(f"Error getting superclasses: {e}", exc_info=True)
         return error_response(str(e), 500)
 
 
 @app.route('/api/ontology/classes/<class_id>/full', methods=['GET'])
+@cached_response()
 def get_class_full(class_id: str):
     """Get class with complete inheritance information"""
     try:
         class_full = get_ontology_service().get_class_full(class_id)
-        return jsonify(success_response(class_full))
+        return _json(success_response(class_full))
     except NodeNotFoundError as e:
         return error_response(str(e), 404)
     except Exception as e:
@@ -312,23 +481,34 @@ def get_class_full(class_id: str):
 
 
 @app.route('/api/ontology/hierarchy', methods=['GET'])
+@cached_response('root')
 def get_hierarchy():
     """Get class hierarchy tree"""
     try:
         root_id = request.args.get('root', 'owl:Thing')
         hierarchy = get_ontology_service().get_class_hierarchy(root_id)
         
-        def serialize_hierarchy(node):
-            return {
+        # Iterative post-order walk: children are serialized before their
+        # parent, so deep hierarchies never hit the recursion limit
+        results = {}
+        stack = [(hierarchy, False)]
+        while stack:
+            node, visited = stack.pop()
+            children = node.children
+            if not visited:
+                stack.append((node, True))
+                stack.extend((child, False) for child in children)
+                continue
+            results[id(node)] = {
                 "class_id": node.class_id,
                 "label": node.label,
                 "parent_id": node.parent_id,
                 "instance_count": node.instance_count,
                 "depth": node.depth,
-                "children": [serialize_hierarchy(child) for child in node.children]
+                "children": [results.pop(id(child)) for child in children]
             }
-        
-        return jsonify(success_response(serialize_hierarchy(hierarchy)))
+
+        return _json(success_response(results[id(hierarchy)]))
     except Exception as e:
         logger.error(f"Error getting hierarchy: {e}", exc_info=True)
         return error_response(str(e), 500)
@@ -339,20 +519,13 @@ def get_hierarchy():
 # ============================================================================
 
 @app.route('/api/ontology/properties', methods=['GET'])
+@cached_response()
 def get_properties():
     """Get all ontology properties"""
     try:
         properties = get_ontology_service().get_all_properties()
-        return jsonify(success_response([
-            {
-                "id": p.id,
-                "label": p.label,
-                "property_type": p.property_type.value,
-                "description": p.description,
-                "domain": p.domain,
-                "range": p.range
-            } for p in properties
-        ]))
+        # orjson encodes the PropertyType enum as its value
+        return _json(success_response(_rows(properties, _PROPERTY_ROW)))
     except Exception as e:
         logger.error(f"Error getting properties: {e}", exc_info=True)
         return error_response(str(e), 500)
@@ -363,7 +536,7 @@ def get_property(property_id: str):
     """Get specific property"""
     try:
         prop = get_ontology_service().get_property(property_id)
-        return jsonify(success_response({
+        return _json(success_response({
             "id": prop.id,
             "label": prop.label,
             "property_type": prop.property_type.value,
@@ -384,18 +557,25 @@ def get_property(property_id: str):
 def create_property():
     """Create new property"""
     try:
-        data = request.get_json()
+        data = _load_json()
         
-        # Parse property type
-        prop_type = PropertyType(data.get('property_type', 'object'))
+        # Parse property type (non-strings such as lists are unhashable, so
+        # they're rejected before the lookup)
+        prop_type_value = data.get('property_type', PropertyType.OBJECT.value)
+        prop_type = (PROPERTY_TYPES_BY_VALUE.get(prop_type_value)
+                     if isinstance(prop_type_value, str) else None)
+        if prop_type is None:
+            return error_response(f"Invalid property type '{prop_type_value}'", 400)
         
-        # Parse characteristics
-        characteristics = set()
-        for char in data.get('characteristics', []):
-            try:
-                characteristics.add(PropertyCharacteristic(char))
-            except ValueError:
-                pass
+        # Parse characteristics (unknown values are ignored)
+        char_values = data.get('characteristics', [])
+        if not isinstance(char_values, list) or not all(isinstance(c, str) for c in char_values):
+            return error_response("characteristics must be a list of strings", 400)
+        characteristics = {
+            PROPERTY_CHARACTERISTICS_BY_VALUE[char]
+            for char in char_values
+            if char in PROPERTY_CHARACTERISTICS_BY_VALUE
+        }
         
         prop_obj = OntologyProperty(
             id=data['id'],
@@ -409,8 +589,9 @@ def create_property():
         )
         
         created = get_ontology_service().create_property(prop_obj)
+        invalidate_response_cache()
         
-        return jsonify(success_response({
+        return _json(success_response({
             "id": created.id,
             "label": created.label,
             "property_type": created.property_type.value,
@@ -432,7 +613,7 @@ def create_property():
 def create_instance():
     """Create new instance"""
     try:
-        data = request.get_json()
+        data = _load_json()
         
         instance_obj = OntologyInstance(
             id=data['id'],
@@ -442,28 +623,23 @@ def create_instance():
         )
         
         # Validate properties against class requirements (including inheritance)
-        validation_errors = []
-        for class_id in instance_obj.class_ids:
-            try:
-                errors = get_ontology_service().validate_instance_properties(
-                    class_id, 
-                    instance_obj.properties
-                )
-                validation_errors.extend(errors)
-            except Exception as e:
-                logger.warning(f"Could not validate against class {class_id}: {e}")
+        validation_errors = get_ontology_service().validate_instance_properties_multi(
+            instance_obj.class_ids,
+            instance_obj.properties
+        )
         
         if validation_errors:
-            return jsonify({
+            return _json({
                 "success": False,
                 "error": "Validation failed",
                 "details": validation_errors,
-                "timestamp": datetime.utcnow().isoformat()
-            }), 422
+                "timestamp": _now_iso()
+            }, 422)
         
         created = get_ontology_service().create_instance(instance_obj)
+        invalidate_response_cache()
         
-        return jsonify(success_response({
+        return _json(success_response({
             "id": created.id,
             "label": created.label,
             "class_ids": created.class_ids,
@@ -482,7 +658,7 @@ def get_instance(instance_id: str):
     """Get specific instance"""
     try:
         inst = get_ontology_service().get_instance(instance_id)
-        return jsonify(success_response({
+        return _json(success_response({
             "id": inst.id,
             "label": inst.label,
             "class_ids": inst.class_ids,
@@ -500,14 +676,8 @@ def get_class_instances(class_id: str):
     """Get all instances of a class"""
     try:
         direct_only = request.args.get('direct', 'true').lower() == 'true'
-        instances = get_ontology_service().get_instances_of_class(class_id, direct_only=direct_only)
-        return jsonify(success_response([
-            {
-                "id": i.id,
-                "label": i.label,
-                "class_ids": i.class_ids
-            } for i in instances
-        ]))
+        instances = get_ontology_service().iter_instances_of_class(class_id, direct_only=direct_only)
+        return _stream_json(instances, _INSTANCE_ROW)
     except Exception as e:
         logger.error(f"Error getting instances: {e}", exc_info=True)
         return error_response(str(e), 500)
@@ -628,7 +798,7 @@ def get_medical_ontology():
                 'parent': str_val(parents[0]) if parents else 'owl:Disease'
             }
 
-        return jsonify(success_response({
+        return _json(success_response({
             'diseases':   diseases,
             'symptoms':   symptoms,
             'treatments': treatments,
@@ -758,7 +928,7 @@ def get_medical_graph():
                         props[pid] = compact_id(obj)
                 instances.append({'id': iid, 'label': ilabel, 'classId': cid, 'properties': props})
 
-        return jsonify(success_response({
+        return _json(success_response({
             'classes':   classes,
             'instances': instances,
             'source':    'sample_data/medical_ontology.ttl',
@@ -779,7 +949,7 @@ def check_consistency():
     """Check ontology consistency"""
     try:
         result = get_ontology_service().check_consistency()
-        return jsonify(success_response({
+        return _json(success_response({
             "consistent": result.consistent,
             "errors": result.errors,
             "warnings": result.warnings,
@@ -791,11 +961,12 @@ def check_consistency():
 
 
 @app.route('/api/ontology/statistics', methods=['GET'])
+@cached_response()
 def get_statistics():
     """Get ontology statistics"""
     try:
         stats = get_ontology_service().get_statistics()
-        return jsonify(success_response({
+        return _json(success_response({
             "total_classes": stats.total_classes,
             "total_properties": stats.total_properties,
             "total_instances": stats.total_instances,
@@ -814,7 +985,7 @@ def validate_ontology():
     """Validate ontology structure"""
     try:
         result = get_ontology_service().validate_ontology()
-        return jsonify(success_response({
+        return _json(success_response({
             "valid": result.valid,
             "errors": result.errors,
             "warnings": result.warnings
@@ -846,7 +1017,6 @@ def export_ontology():
         content_type = content_types.get(format_type.lower(), "application/rdf+xml")
 
         # Return raw RDF content
-        from flask import Response
         return Response(rdf_content, mimetype=content_type)
     except Exception as e:
         logger.error(f"Error exporting ontology: {e}", exc_info=True)
@@ -874,7 +1044,7 @@ def import_ontology():
                 format_type = 'xml'
         else:
             # Get from JSON body
-            data = request.get_json()
+            data = _load_json()
             rdf_content = data.get('content')
             format_type = data.get('format', 'xml')
 
@@ -889,8 +1059,9 @@ def import_ontology():
             format=format_type,
             clear_existing=clear_existing
         )
+        invalidate_response_cache()
 
-        return jsonify(success_response(counts, "Ontology imported successfully"))
+        return _json(success_response(counts, "Ontology imported successfully"))
 
     except ValidationError as e:
         return error_response(str(e), 400)
@@ -929,7 +1100,7 @@ def get_paginated_nodes():
             search_query=search_query
         )
         
-        return jsonify(success_response(result))
+        return _json(success_response(result))
         
     except Exception as e:
         logger.error(f"Error getting paginated nodes: {e}", exc_info=True)
@@ -949,7 +1120,7 @@ def get_viewport():
         JSON with nodes, edges, distance levels
     """
     try:
-        data = request.get_json()
+        data = _load_json()
         
         if not data or 'center_node' not in data:
             return error_response("Missing 'center_node' in request body", 400)
@@ -964,8 +1135,10 @@ def get_viewport():
             limit=limit
         )
         
-        return jsonify(success_response(result))
+        return _json(success_response(result))
         
+    except ValidationError as e:
+        return error_response(str(e), 400)
     except Exception as e:
         logger.error(f"Error getting viewport: {e}", exc_info=True)
         return error_response(str(e), 500)
@@ -992,7 +1165,7 @@ def get_neighbors(node_id):
             depth=depth
         )
         
-        return jsonify(success_response(result))
+        return _json(success_response(result))
         
     except Exception as e:
         logger.error(f"Error getting neighbors: {e}", exc_info=True)
@@ -1006,7 +1179,7 @@ def get_neighbors(node_id):
 @app.route('/api/ontology/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify(success_response({
+    return _json(success_response({
         "status": "healthy",
         "service": "Ontology Editor API",
         "version": "1.0.0"
@@ -1016,66 +1189,58 @@ def health_check():
 @app.route('/')
 def index():
     """Render main page"""
-    return """
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Ontology Editor API</title>
-        <style>
-            body { font-family: Arial, sans-serif; max-width: 800px; margin: 50px auto; padding: 20px; }
-            h1 { color: #2c3e50; }
-            .endpoint { background: #f8f9fa; padding: 10px; margin: 10px 0; border-left: 3px solid #3498db; }
-            code { background: #e9ecef; padding: 2px 6px; border-radius: 3px; }
-        </style>
-    </head>
-    <body>
-        <h1>🧠 Ontology Editor API</h1>
-        <p>RESTful API for semantic ontology management</p>
-        
-        <h2>Available Endpoints</h2>
-        
-        <div class="endpoint">
-            <strong>GET /api/ontology/classes</strong> - List all classes
-        </div>
-        <div class="endpoint">
-            <strong>POST /api/ontology/classes</strong> - Create new class
-        </div>
-        <div class="endpoint">
-            <strong>GET /api/ontology/classes/{id}</strong> - Get class details
-        </div>
-        <div class="endpoint">
-            <strong>GET /api/ontology/hierarchy</strong> - Get class hierarchy
-        </div>
-        <div class="endpoint">
-            <strong>GET /api/ontology/properties</strong> - List all properties
-        </div>
-        <div class="endpoint">
-            <strong>POST /api/ontology/properties</strong> - Create new property
-        </div>
-        <div class="endpoint">
-            <strong>POST /api/ontology/instances</strong> - Create new instance
-        </div>
-        <div class="endpoint">
-            <strong>GET /api/ontology/statistics</strong> - Get ontology stats
-        </div>
-        <div class="endpoint">
-            <strong>GET /api/ontology/reasoning/consistency</strong> - Check consistency
-        </div>
-        
-        <h2>Quick Start</h2>
-        <p>Create a class:</p>
-        <pre><code>curl -X POST http://localhost:5002/api/ontology/classes \\
-  -H "Content-Type: application/json" \\
-  -d '{"id": "Person", "label": "Person", "description": "A human being"}'</code></pre>
-        
-        <h2>Documentation</h2>
-        <p>See <code>ONTOLOGY_EDITOR_PRODUCT.md</code> for full documentation</p>
-    </body>
-    </html>
+    return send_from_directory(app.static_folder, 'index.html', max_age=3600)
+
+
+# ============================================================================
+# Startup
+# ============================================================================
+
+def _warm_services():
+    """Build the ontology service and demo data before the first request"""
+    try:
+        get_ontology_service().materialize_inferences()
+    except Exception as e:
+        logger.error(f"Error pre-warming ontology service: {e}", exc_info=True)
+
+
+def start_warmup():
+    """
+    Warm up in the background so worker boot stays fast
+    
+    Called by the serving process only (gunicorn's post_worker_init, the
+    --dev server's reloader child), not on import. Requests that arrive
+    early simply wait on the init lock.
     """
+    threading.Thread(target=_warm_services, name="ontology-warmup", daemon=True).start()
 
 
 if __name__ == '__main__':
-    logger.info("Starting Ontology Editor API server...")
-    logger.info("Server running at http://localhost:5002")
-    app.run(host='0.0.0.0', port=5002, debug=True)
+    import argparse
+    import os
+    import sys
+    
+    parser = argparse.ArgumentParser(description="Ontology Editor API server")
+    parser.add_argument('--dev', action='store_true',
+                        help="Run Flask's debug server with auto-reload instead of gunicorn")
+    args = parser.parse_args()
+    
+    if args.dev:
+        # With the reloader, this process only watches files; the child it
+        # spawns (WERKZEUG_RUN_MAIN set) is the one that serves
+        if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+            start_warmup()
+        logger.info("Starting Ontology Editor API development server...")
+        logger.info("Server running at http://localhost:5002")
+        app.run(host='0.0.0.0', port=5002, debug=True, threaded=True)
+    else:
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        logger.info("Starting Ontology Editor API under gunicorn...")
+        # Run gunicorn under this interpreter so it's found in the same
+        # environment even when that venv isn't activated (not on PATH)
+        os.execv(sys.executable, [
+            sys.executable, '-m', 'gunicorn',
+            '--chdir', base_dir,
+            '-c', os.path.join(base_dir, 'gunicorn.conf.py'),
+            'ontology_api:app',
+        ])
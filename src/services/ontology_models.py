@@ -17,6 +17,10 @@ class PropertyType(Enum):
     ANNOTATION = "annotation"  # Metadata annotations
 
 
+# Value -> member lookup; avoids Enum.__call__ on hot parsing paths
+PROPERTY_TYPES_BY_VALUE: Dict[str, PropertyType] = {t.value: t for t in PropertyType}
+
+
 class PropertyCharacteristic(Enum):
     """Property characteristics for reasoning"""
     FUNCTIONAL = "functional"  # Max one value per subject
@@ -28,12 +32,18 @@ class PropertyCharacteristic(Enum):
     IRREFLEXIVE = "irreflexive"  # Not A→A for any A
 
 
-@dataclass
+PROPERTY_CHARACTERISTICS_BY_VALUE: Dict[str, PropertyCharacteristic] = {
+    c.value: c for c in PropertyCharacteristic
+}
+
+
+@dataclass(slots=True)
 class OntologyClass:
     """
     Represents an ontology class (concept)
     
-    Similar to OWL classes or RDFS classes
+    Similar to OWL classes or RDFS classes. Slotted (no per-instance
+    __dict__) since the service builds these for every class on list reads.
     """
     id: str
     label: str
@@ -50,7 +60,7 @@ class OntologyClass:
             self.label = self.id
 
 
-@dataclass
+@dataclass(slots=True)
 class OntologyProperty:
     """
     Represents an ontology property (relationship or attribute)
@@ -75,7 +85,7 @@ class OntologyProperty:
             self.property_type = PropertyType(self.property_type)
 
 
-@dataclass
+@dataclass(slots=True)
 class OntologyInstance:
     """
     Represents an instance (individual) of ontology classes
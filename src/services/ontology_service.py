@@ -5,7 +5,14 @@ Service layer for ontology operations, built on top of GraphService.
 Provides semantic capabilities like class hierarchies, properties, and reasoning.
 """
 
-from typing import List, Optional, Dict, Any, Set
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from functools import wraps
+from itertools import chain, islice
+from typing import List, Optional, Dict, Any, Set, Tuple, Iterator
 from src.services.graph_service import GraphService
 from src.services.base_service import (
     NodeNotFoundError,
@@ -25,10 +32,28 @@ from src.services.ontology_models import (
     ValidationResult,
     PropertyType,
     PropertyCharacteristic,
+    PROPERTY_TYPES_BY_VALUE,
+    PROPERTY_CHARACTERISTICS_BY_VALUE,
     XSDDatatype,
 )
 from graph_db import GraphDB
 
+logger = logging.getLogger(__name__)
+
+
+def _synchronized(method):
+    """
+    Run a service method under the service lock
+    
+    The indexes and memos are shared by every request thread; writers and
+    readers that walk them take the lock so neither sees the other half done.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class OntologyService:
     """
@@ -41,15 +66,19 @@ class OntologyService:
     - Basic reasoning and inference
     """
     
-    # Special node/edge labels for ontology elements
-    CLASS_TYPE = "owl:Class"
-    PROPERTY_TYPE = "owl:Property"
-    INSTANCE_TYPE = "owl:Individual"
-    SUBCLASS_RELATION = "rdfs:subClassOf"
-    SUBPROPERTY_RELATION = "rdfs:subPropertyOf"
-    TYPE_RELATION = "rdf:type"
-    DOMAIN_RELATION = "rdfs:domain"
-    RANGE_RELATION = "rdfs:range"
+    # Special node/edge labels for ontology elements (interned, like the
+    # ids and labels stored in the indexes, so lookups match by identity)
+    CLASS_TYPE = sys.intern("owl:Class")
+    PROPERTY_TYPE = sys.intern("owl:Property")
+    INSTANCE_TYPE = sys.intern("owl:Individual")
+    SUBCLASS_RELATION = sys.intern("rdfs:subClassOf")
+    SUBPROPERTY_RELATION = sys.intern("rdfs:subPropertyOf")
+    TYPE_RELATION = sys.intern("rdf:type")
+    DOMAIN_RELATION = sys.intern("rdfs:domain")
+    RANGE_RELATION = sys.intern("rdfs:range")
+    
+    # Relations whose closure _transitive_reachable computes
+    _TRANSITIVE_LABELS = frozenset({SUBCLASS_RELATION, SUBPROPERTY_RELATION})
     
     def __init__(self, graph_db: Optional[GraphDB] = None):
         """
@@ -58,16 +87,232 @@ class OntologyService:
         Args:
             graph_db: Optional existing GraphDB instance
         """
+        # Reentrant: locked methods call each other
+        self._lock = threading.RLock()
         self.graph_service = GraphService(graph_db)
         self.graph = self.graph_service.graph
+        self._get_node = self.graph.get_node
+        
+        # Edge indexes: label -> node -> adjacent nodes, in insertion order.
+        # Kept in sync by this service's own writes (see _add_edge).
+        self._out_by_label: Dict[str, Dict[str, List[str]]] = {}
+        self._in_by_label: Dict[str, Dict[str, List[str]]] = {}
+        self._edge_labels: Dict[Tuple[str, str], str] = {}
+        self._nodes_by_type: Dict[str, Set[str]] = {}
+        
+        # Derived data cached between mutations (see _invalidate_caches)
+        self._required_props_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._class_full_cache: Dict[str, Dict[str, Any]] = {}
+        self._hierarchy_cache: Dict[str, ClassHierarchy] = {}
+        self._class_cache: Dict[str, OntologyClass] = {}
+        self._property_cache: Dict[str, OntologyProperty] = {}
+        self._instance_cache: Dict[str, OntologyInstance] = {}
+        self._inherited_props_cache: Dict[str, List[Dict[str, Any]]] = {}
+        self._props_by_domain: Optional[Dict[str, List[OntologyProperty]]] = None
+        self._closure_cache: Dict[Tuple[str, str, str], Tuple[str, ...]] = {}
+        
+        # Forward-chained inferences (see materialize_inferences) as
+        # (generation, result, members by class), valid while the
+        # generation matches the mutation counter
+        self._generation = 0
+        self._inferences: Optional[
+            Tuple[int, ReasoningResult, Dict[str, Tuple[str, ...]]]
+        ] = None
+        self._snapshot: Optional['OntologySnapshot'] = None
+        
         self._initialize_ontology()
+        self._rebuild_indexes()
+    
+    def _rebuild_indexes(self):
+        """Rebuild the node type and edge indexes from the graph"""
+        self._out_by_label = {}
+        self._in_by_label = {}
+        self._edge_labels = {}
+        self._nodes_by_type = {
+            self.CLASS_TYPE: set(),
+            self.PROPERTY_TYPE: set(),
+            self.INSTANCE_TYPE: set(),
+        }
+        
+        # Walk adjacency lists rather than get_all_edges(): edge keys are
+        # colon-delimited, so ids like "demo:Person" don't split back cleanly
+        for node_id in self.graph.get_all_nodes():
+            self._index_node(node_id, self._get_node_data(node_id))
+            for neighbor in self.graph.get_neighbors(node_id):
+                to_node = neighbor.get('to')
+                edge_data = self.graph.get_edge(node_id, to_node)
+                if edge_data and edge_data.get('label'):
+                    self._index_edge(node_id, to_node, edge_data['label'])
+    
+    @_synchronized
+    def refresh_indexes(self):
+        """
+        Resynchronize derived data with the graph
+        
+        Only needed after writing to self.graph directly instead of
+        through this service.
+        """
+        self._rebuild_indexes()
+        self._invalidate_caches()
+    
+    def _index_node(self, node_id: str, node_data: Dict[str, Any]):
+        """Record a node under its ontology node_type"""
+        ids = self._nodes_by_type.get(node_data.get('node_type'))
+        if ids is not None:
+            ids.add(sys.intern(node_id))
+    
+    def _add_node(self, node_id: str, node_data: Dict[str, Any]):
+        """Add a node to the graph and the type index"""
+        if self.graph.add_node(node_id, data=node_data):
+            self._index_node(node_id, node_data)
+    
+    @_synchronized
+    def _ids_of_type(self, node_type: str) -> List[str]:
+        """Ids of all nodes of an ontology node_type, in id order"""
+        return sorted(self._nodes_by_type[node_type])
+    
+    def _index_edge(self, from_node: str, to_node: str, label: str):
+        """Record an edge in the indexes (replacing any edge for the same pair)"""
+        # One shared string per id/label however many edges mention it
+        from_node = sys.intern(from_node)
+        to_node = sys.intern(to_node)
+        label = sys.intern(label)
+        
+        previous = self._edge_labels.get((from_node, to_node))
+        if previous is not None:
+            self._unindex_edge(from_node, to_node, previous)
+        
+        self._edge_labels[(from_node, to_node)] = label
+        self._out_by_label.setdefault(label, {}).setdefault(from_node, []).append(to_node)
+        self._in_by_label.setdefault(label, {}).setdefault(to_node, []).append(from_node)
+    
+    def _unindex_edge(self, from_node: str, to_node: str, label: str):
+        """Remove an edge from the indexes"""
+        del self._edge_labels[(from_node, to_node)]
+        
+        targets = self._out_by_label[label][from_node]
+        targets.remove(to_node)
+        if not targets:
+            del self._out_by_label[label][from_node]
+        
+        sources = self._in_by_label[label][to_node]
+        sources.remove(from_node)
+        if not sources:
+            del self._in_by_label[label][to_node]
+    
+    def _unindex_node(self, node_id: str):
+        """Remove a node and all edges to and from it from the indexes"""
+        for ids in self._nodes_by_type.values():
+            ids.discard(node_id)
+        for label, out_edges in self._out_by_label.items():
+            for to_node in list(out_edges.get(node_id, ())):
+                self._unindex_edge(node_id, to_node, label)
+        for label, in_edges in self._in_by_label.items():
+            for from_node in list(in_edges.get(node_id, ())):
+                self._unindex_edge(from_node, node_id, label)
+    
+    def _add_edge(self, from_node: str, to_node: str, label: str, weight: float = 1.0):
+        """Add a labeled edge to the graph and the indexes"""
+        if self.graph.add_edge(from_node, to_node, weight=weight, label=label):
+            self._index_edge(from_node, to_node, label)
+    
+    def _out_edges(self, label: str) -> Dict[str, List[str]]:
+        """Map of source node -> target nodes for edges with a label"""
+        return self._out_by_label.get(label, {})
+    
+    def _in_edges(self, label: str) -> Dict[str, List[str]]:
+        """Map of target node -> source nodes for edges with a label"""
+        return self._in_by_label.get(label, {})
+    
+    def _invalidate_caches(self):
+        """Drop derived data after the ontology changes"""
+        # Bump first so a fill racing this clear sees the new generation
+        # in _store_memo and discards itself
+        self._generation += 1
+        self._required_props_cache.clear()
+        self._class_full_cache.clear()
+        self._hierarchy_cache.clear()
+        self._class_cache.clear()
+        self._property_cache.clear()
+        self._instance_cache.clear()
+        self._inherited_props_cache.clear()
+        self._props_by_domain = None
+        self._closure_cache.clear()
+    
+    def _store_memo(self, cache: Dict, key: Any, value: Any, generation: int) -> None:
+        """
+        Memoize a value computed at the given generation
+        
+        Checked after the write: a mutation that bumped the generation
+        either sees the entry in its clear or is seen here and dropped.
+        """
+        cache[key] = value
+        if self._generation != generation:
+            cache.pop(key, None)
+    
+    @_synchronized
+    def _transitive_reachable(self, seed: str, label: str, direction: str = "up",
+                              include_self: bool = False) -> Tuple[str, ...]:
+        """
+        Nodes reachable from seed over a transitive relation, memoized
+        
+        Breadth-first over the label index. "up" follows edges from child
+        to parent (superclasses), "down" the reverse (subclasses).
+        
+        Args:
+            seed: Starting node
+            label: One of _TRANSITIVE_LABELS
+            direction: "up" or "down"
+            include_self: Reflexive closure (seed first); otherwise seed is
+                excluded even when it lies on a cycle
+            
+        Returns:
+            Reachable node ids in BFS order, each once
+        """
+        if label not in self._TRANSITIVE_LABELS:
+            raise ValueError(f"'{label}' is not a transitive relation")
+        
+        key = (seed, label, direction)
+        reached = self._closure_cache.get(key)
+        if reached is None:
+            generation = self._generation
+            adjacency = self._out_edges(label) if direction == "up" else self._in_edges(label)
+            seen = {seed}
+            order: List[str] = []
+            queue = deque(adjacency.get(seed, ()))
+            
+            while queue:
+                node = queue.popleft()
+                if node in seen:
+                    continue
+                seen.add(node)
+                order.append(node)
+                queue.extend(adjacency.get(node, ()))
+            
+            reached = tuple(order)
+            self._store_memo(self._closure_cache, key, reached, generation)
+        
+        return (seed,) + reached if include_self else reached
+    
+    def _classes_by_id(self, class_ids) -> List[OntologyClass]:
+        """Load classes by id, skipping any that can't be read"""
+        return list(self._iter_classes_by_id(class_ids))
+    
+    def _iter_classes_by_id(self, class_ids) -> Iterator[OntologyClass]:
+        """Load classes by id as they are consumed, skipping any that can't be read"""
+        for class_id in class_ids:
+            try:
+                yield self.get_class(class_id)
+            except Exception:
+                continue
     
     def _get_node_data(self, node_id: str) -> Dict[str, Any]:
         """Helper method to get node data from GraphDB"""
-        node_result = self.graph.get_node(node_id)
-        if node_result and isinstance(node_result, dict) and 'data' in node_result:
+        node_result = self._get_node(node_id)
+        try:
             return node_result['data']
-        return node_result or {}
+        except (KeyError, TypeError):
+            return node_result or {}
     
     def _initialize_ontology(self):
         """Initialize root ontology concepts"""
@@ -86,6 +331,7 @@ class OntologyService:
     # Class Operations
     # ========================================================================
     
+    @_synchronized
     def create_class(self, class_obj: OntologyClass) -> OntologyClass:
         """
         Create a new ontology class
@@ -108,41 +354,112 @@ class OntologyService:
                 raise NodeNotFoundError(f"Parent class '{parent_id}' not found")
         
         # Create class node
-        node_data = {
-            "label": class_obj.label,
-            "node_type": self.CLASS_TYPE,
-            "description": class_obj.description or "",
-            "is_abstract": class_obj.is_abstract,
-        }
-        node_data.update(class_obj.properties)
-        self.graph.add_node(class_obj.id, data=node_data)
+        self._add_node(class_obj.id, self._class_node_data(class_obj))
         
         # Add parent relationships (if no parents, default to owl:Thing)
         if not class_obj.parent_classes:
             class_obj.parent_classes = ["owl:Thing"]
         
         for parent_id in class_obj.parent_classes:
-            self.graph.add_edge(
-                class_obj.id,
-                parent_id,
-                label=self.SUBCLASS_RELATION,
-                weight=1.0
-            )
+            self._add_edge(class_obj.id, parent_id, self.SUBCLASS_RELATION, weight=1.0)
         
         # Add equivalent class relationships
         for equiv_id in class_obj.equivalent_classes:
             if self.graph.node_exists(equiv_id):
-                self.graph.add_edge(class_obj.id, equiv_id, label="owl:equivalentClass")
+                self._add_edge(class_obj.id, equiv_id, "owl:equivalentClass")
         
         # Add disjoint class relationships
         for disj_id in class_obj.disjoint_classes:
             if self.graph.node_exists(disj_id):
-                self.graph.add_edge(class_obj.id, disj_id, label="owl:disjointWith")
+                self._add_edge(class_obj.id, disj_id, "owl:disjointWith")
         
+        self._invalidate_caches()
         return class_obj
     
+    def _class_node_data(self, class_obj: OntologyClass) -> Dict[str, Any]:
+        """Node data stored for a class"""
+        node_data = {
+            "label": class_obj.label,
+            "node_type": self.CLASS_TYPE,
+            "description": class_obj.description or "",
+            "is_abstract": class_obj.is_abstract,
+        }
+        node_data.update(class_obj.properties)
+        return node_data
+    
+    @_synchronized
+    def create_classes_bulk(self, class_objs: List[OntologyClass]) -> List[OntologyClass]:
+        """
+        Create many classes with one batched graph write
+        
+        A class may use classes earlier in the same batch as parents. The
+        whole batch is validated before anything is written, so a failing
+        batch leaves the ontology unchanged.
+        
+        Args:
+            class_objs: OntologyClass definitions
+            
+        Returns:
+            Created classes
+            
+        Raises:
+            ValidationError: If a class already exists
+            NodeNotFoundError: If a parent class is missing
+        """
+        existing = set(self.graph.get_all_nodes())
+        for class_obj in class_objs:
+            if class_obj.id in existing:
+                raise ValidationError(f"Class '{class_obj.id}' already exists")
+            for parent_id in class_obj.parent_classes:
+                if parent_id not in existing:
+                    raise NodeNotFoundError(f"Parent class '{parent_id}' not found")
+            existing.add(class_obj.id)
+        
+        nodes = []
+        edges = []
+        for class_obj in class_objs:
+            nodes.append((class_obj.id, self._class_node_data(class_obj)))
+            
+            if not class_obj.parent_classes:
+                class_obj.parent_classes = ["owl:Thing"]
+            
+            edges.extend((class_obj.id, p, self.SUBCLASS_RELATION) for p in class_obj.parent_classes)
+            edges.extend(
+                (class_obj.id, e, "owl:equivalentClass")
+                for e in class_obj.equivalent_classes if e in existing
+            )
+            edges.extend(
+                (class_obj.id, d, "owl:disjointWith")
+                for d in class_obj.disjoint_classes if d in existing
+            )
+        
+        self._write_bulk(nodes, edges)
+        return class_objs
+    
+    def _write_bulk(self, nodes: List[Tuple[str, Dict[str, Any]]],
+                    edges: List[Tuple[str, str, str]]):
+        """Write validated nodes and (from, to, label) edges in one batch"""
+        self.graph.add_nodes_bulk(nodes)
+        for node_id, node_data in nodes:
+            self._index_node(node_id, node_data)
+        self.graph.add_edges_bulk([(f, t, 1.0, label) for f, t, label in edges])
+        for from_node, to_node, label in edges:
+            self._index_edge(from_node, to_node, label)
+        self._invalidate_caches()
+    
+    @_synchronized
     def get_class(self, class_id: str) -> OntologyClass:
-        """Get class by ID"""
+        """
+        Get class by ID
+        
+        Classes are memoized until the next mutation; treat the returned
+        object as read-only.
+        """
+        cached = self._class_cache.get(class_id)
+        if cached is not None:
+            return cached
+        
+        generation = self._generation
         if not self.graph.node_exists(class_id):
             raise NodeNotFoundError(f"Class '{class_id}' not found")
         
@@ -152,33 +469,73 @@ class OntologyService:
             raise ValidationError(f"Node '{class_id}' is not a class")
         
         # Get parent classes
-        parent_classes = []
-        edges = self.graph.get_all_edges()
-        for from_node, to_node, weight in edges:
-            edge_data = self.graph.get_edge(from_node, to_node)
-            if from_node == class_id and edge_data and edge_data.get('label') == self.SUBCLASS_RELATION:
-                parent_classes.append(to_node)
-        
-        return OntologyClass(
+        parent_classes = list(self._out_edges(self.SUBCLASS_RELATION).get(class_id, ()))
+        
+        class_obj = OntologyClass(
             id=class_id,
             label=node_data.get('label', class_id),
             description=node_data.get('description'),
             parent_classes=parent_classes,
             is_abstract=node_data.get('is_abstract', False)
         )
+        self._store_memo(self._class_cache, class_id, class_obj, generation)
+        return class_obj
     
-    def get_all_classes(self) -> List[OntologyClass]:
-        """Get all ontology classes"""
-        classes = []
-        for node_id in self.graph.get_all_nodes():
-            node_data = self._get_node_data(node_id)
-            if node_data and node_data.get('node_type') == self.CLASS_TYPE:
+    def iter_classes(self, limit: Optional[int] = None, offset: int = 0) -> Iterator[OntologyClass]:
+        """
+        Iterate ontology classes in id order, building each on demand
+        
+        Args:
+            limit: Maximum number of classes to yield
+            offset: Number of classes to skip first
+        """
+        def classes():
+            for node_id in self._ids_of_type(self.CLASS_TYPE):
                 try:
-                    classes.append(self.get_class(node_id))
+                    yield self.get_class(node_id)
                 except Exception:
                     continue
-        return classes
+        
+        stop = None if limit is None else offset + limit
+        return islice(classes(), offset, stop)
+    
+    def get_all_classes(self, limit: Optional[int] = None, offset: int = 0) -> List[OntologyClass]:
+        """Get all ontology classes"""
+        return list(self.iter_classes(limit, offset))
+    
+    @_synchronized
+    def get_all_classes_columnar(self) -> Dict[str, List[Any]]:
+        """
+        Get all ontology classes as parallel column lists
+        
+        Reads the store once instead of building an OntologyClass per class.
+        
+        Returns:
+            Dict mapping field name (id, label, description, parent_classes,
+            is_abstract) to a list with one entry per class, in id order
+        """
+        parents = self._out_edges(self.SUBCLASS_RELATION)
+        
+        columns = {
+            "id": [],
+            "label": [],
+            "description": [],
+            "parent_classes": [],
+            "is_abstract": [],
+        }
+        ids, labels, descriptions, parent_lists, abstract_flags = columns.values()
+        
+        for node_id in self._ids_of_type(self.CLASS_TYPE):
+            node_data = self._get_node_data(node_id)
+            ids.append(node_id)
+            labels.append(node_data.get('label') or node_id)
+            descriptions.append(node_data.get('description'))
+            parent_lists.append(list(parents.get(node_id, ())))
+            abstract_flags.append(node_data.get('is_abstract', False))
+        
+        return columns
     
+    @_synchronized
     def delete_class(self, class_id: str, force: bool = False):
         """
         Delete a class
@@ -203,7 +560,10 @@ class OntologyService:
                 )
         
         self.graph_service.delete_node(class_id)
+        self._unindex_node(class_id)
+        self._invalidate_caches()
     
+    @_synchronized
     def get_class_hierarchy(self, root_id: Optional[str] = None) -> ClassHierarchy:
         """
         Get class hierarchy tree
@@ -212,31 +572,54 @@ class OntologyService:
             root_id: Root class ID (defaults to owl:Thing)
             
         Returns:
-            ClassHierarchy tree structure
+            ClassHierarchy tree structure (memoized until the next mutation;
+            treat as read-only)
         """
         if root_id is None:
             root_id = "owl:Thing"
         
-        def build_hierarchy(class_id: str, depth: int = 0) -> ClassHierarchy:
-            class_obj = self.get_class(class_id)
-            subclasses = self.get_subclasses(class_id, direct_only=True)
-            instance_count = len(self.get_instances_of_class(class_id, direct_only=True))
+        cached = self._hierarchy_cache.get(root_id)
+        if cached is not None:
+            return cached
+        
+        generation = self._generation
+        
+        # Explicit DFS so deep hierarchies don't hit the recursion limit.
+        # (None, ...) entries mark leaving a class, keeping on_path to the
+        # current branch so a subclass cycle is cut instead of followed.
+        hierarchy = None
+        on_path: Set[str] = set()
+        stack: List[Tuple[Optional[str], int, Optional[ClassHierarchy]]] = [(root_id, 0, None)]
+        
+        while stack:
+            class_id, depth, parent = stack.pop()
+            if class_id is None:
+                on_path.discard(parent.class_id)
+                continue
+            if class_id in on_path:
+                continue
             
+            class_obj = self.get_class(class_id)
             node = ClassHierarchy(
                 class_id=class_id,
                 label=class_obj.label,
-                instance_count=instance_count,
+                instance_count=len(self.get_instances_of_class(class_id, direct_only=True)),
                 depth=depth
             )
+            if parent is None:
+                hierarchy = node
+            else:
+                node.parent_id = parent.class_id
+                parent.children.append(node)
             
-            for subclass in subclasses:
-                child = build_hierarchy(subclass.id, depth + 1)
-                child.parent_id = class_id
-                node.children.append(child)
-            
-            return node
+            on_path.add(class_id)
+            stack.append((None, depth, node))
+            # Reversed so children are visited, and appended, in index order
+            subclasses = self.get_subclasses(class_id, direct_only=True)
+            stack.extend((sub.id, depth + 1, node) for sub in reversed(subclasses))
         
-        return build_hierarchy(root_id)
+        self._store_memo(self._hierarchy_cache, root_id, hierarchy, generation)
+        return hierarchy
     
     def get_subclasses(self, class_id: str, direct_only: bool = False) -> List[OntologyClass]:
         """
@@ -249,82 +632,133 @@ class OntologyService:
         Returns:
             List of subclasses
         """
-        subclasses = []
-        edges = self.graph.get_all_edges()
-        
-        for from_node, to_node, weight in edges:
-            if to_node == class_id:
-                edge_data = self.graph.get_edge(from_node, to_node)
-                if edge_data and edge_data.get('label') == self.SUBCLASS_RELATION:
-                    try:
-                        subclasses.append(self.get_class(from_node))
-                        
-                        # Recursively get indirect subclasses
-                        if not direct_only:
-                            indirect = self.get_subclasses(from_node, direct_only=False)
-                            subclasses.extend(indirect)
-                    except Exception:
-                        continue
-        
-        return subclasses
+        return list(self.iter_subclasses(class_id, direct_only))
+    
+    @_synchronized
+    def iter_subclasses(self, class_id: str, direct_only: bool = False) -> Iterator[OntologyClass]:
+        """
+        Iterate subclasses of a class, building each on demand
+        
+        The ids are resolved up front; only the class objects are lazy.
+        """
+        if direct_only:
+            child_ids = tuple(self._in_edges(self.SUBCLASS_RELATION).get(class_id, ()))
+        else:
+            child_ids = self._transitive_reachable(class_id, self.SUBCLASS_RELATION, "down")
+        
+        return self._iter_classes_by_id(child_ids)
     
     def get_superclasses(self, class_id: str, direct_only: bool = False) -> List[OntologyClass]:
         """Get superclasses (ancestors) of a class"""
-        superclasses = []
-        edges = self.graph.get_all_edges()
-        
-        for from_node, to_node, weight in edges:
-            if from_node == class_id:
-                edge_data = self.graph.get_edge(from_node, to_node)
-                if edge_data and edge_data.get('label') == self.SUBCLASS_RELATION:
-                    try:
-                        superclasses.append(self.get_class(to_node))
-                        
-                        if not direct_only:
-                            indirect = self.get_superclasses(to_node, direct_only=False)
-                            superclasses.extend(indirect)
-                    except Exception:
-                        continue
-        
-        return superclasses
+        return list(self.iter_superclasses(class_id, direct_only))
+    
+    @_synchronized
+    def iter_superclasses(self, class_id: str, direct_only: bool = False) -> Iterator[OntologyClass]:
+        """Iterate superclasses (ancestors) of a class, building each on demand"""
+        if direct_only:
+            parent_ids = tuple(self._out_edges(self.SUBCLASS_RELATION).get(class_id, ()))
+        else:
+            parent_ids = self._transitive_reachable(class_id, self.SUBCLASS_RELATION, "up")
+        
+        return self._iter_classes_by_id(parent_ids)
     
     # ========================================================================
     # Property Operations
     # ========================================================================
     
+    @_synchronized
     def create_property(self, prop_obj: OntologyProperty) -> OntologyProperty:
         """Create a new ontology property"""
         if self.graph.node_exists(prop_obj.id):
             raise ValidationError(f"Property '{prop_obj.id}' already exists")
         
+        # Validate parent properties exist
+        for parent_id in prop_obj.parent_properties:
+            if not self.graph.node_exists(parent_id):
+                raise NodeNotFoundError(f"Parent property '{parent_id}' not found")
+        
         # Create property node
-        self.graph.add_node(
-            prop_obj.id,
-            data={
-                "label": prop_obj.label,
-                "node_type": self.PROPERTY_TYPE,
-                "property_type": prop_obj.property_type.value,
-                "description": prop_obj.description or "",
-                "inverse_of": prop_obj.inverse_of or "",
-                "characteristics": ",".join(c.value for c in prop_obj.characteristics)
-            }
-        )
+        self._add_node(prop_obj.id, self._property_node_data(prop_obj))
+        
+        for parent_id in prop_obj.parent_properties:
+            self._add_edge(prop_obj.id, parent_id, self.SUBPROPERTY_RELATION)
         
         # Add domain relationships
         for domain_class in prop_obj.domain:
             if self.graph.node_exists(domain_class):
-                self.graph.add_edge(prop_obj.id, domain_class, label=self.DOMAIN_RELATION)
+                self._add_edge(prop_obj.id, domain_class, self.DOMAIN_RELATION)
         
         # Add range relationships
         for range_class in prop_obj.range:
             # Range can be class or datatype
             if self.graph.node_exists(range_class):
-                self.graph.add_edge(prop_obj.id, range_class, label=self.RANGE_RELATION)
+                self._add_edge(prop_obj.id, range_class, self.RANGE_RELATION)
         
+        self._invalidate_caches()
         return prop_obj
     
+    def _property_node_data(self, prop_obj: OntologyProperty) -> Dict[str, Any]:
+        """Node data stored for a property"""
+        return {
+            "label": prop_obj.label,
+            "node_type": self.PROPERTY_TYPE,
+            "property_type": prop_obj.property_type.value,
+            "description": prop_obj.description or "",
+            "inverse_of": prop_obj.inverse_of or "",
+            "characteristics": ",".join(c.value for c in prop_obj.characteristics)
+        }
+    
+    @_synchronized
+    def create_properties_bulk(self, prop_objs: List[OntologyProperty]) -> List[OntologyProperty]:
+        """
+        Create many properties with one batched graph write
+        
+        Domain and range entries that don't name an existing node are
+        skipped, as in create_property.
+        
+        Raises:
+            ValidationError: If a property already exists
+            NodeNotFoundError: If a parent property is missing
+        """
+        existing = set(self.graph.get_all_nodes())
+        for prop_obj in prop_objs:
+            if prop_obj.id in existing:
+                raise ValidationError(f"Property '{prop_obj.id}' already exists")
+            for parent_id in prop_obj.parent_properties:
+                if parent_id not in existing:
+                    raise NodeNotFoundError(f"Parent property '{parent_id}' not found")
+            existing.add(prop_obj.id)
+        
+        nodes = []
+        edges = []
+        for prop_obj in prop_objs:
+            nodes.append((prop_obj.id, self._property_node_data(prop_obj)))
+            edges.extend(
+                (prop_obj.id, p, self.SUBPROPERTY_RELATION) for p in prop_obj.parent_properties
+            )
+            edges.extend(
+                (prop_obj.id, d, self.DOMAIN_RELATION) for d in prop_obj.domain if d in existing
+            )
+            edges.extend(
+                (prop_obj.id, r, self.RANGE_RELATION) for r in prop_obj.range if r in existing
+            )
+        
+        self._write_bulk(nodes, edges)
+        return prop_objs
+    
+    @_synchronized
     def get_property(self, property_id: str) -> OntologyProperty:
-        """Get property by ID"""
+        """
+        Get property by ID
+        
+        Parsed properties are memoized until the next mutation; treat the
+        returned object as read-only.
+        """
+        cached = self._property_cache.get(property_id)
+        if cached is not None:
+            return cached
+        
+        generation = self._generation
         if not self.graph.node_exists(property_id):
             raise NodeNotFoundError(f"Property '{property_id}' not found")
         
@@ -334,61 +768,94 @@ class OntologyService:
             raise ValidationError(f"Node '{property_id}' is not a property")
         
         # Get domain and range
-        domain = []
-        range_list = []
-        edges = self.graph.get_all_edges()
-        
-        for from_node, to_node, weight in edges:
-            if from_node == property_id:
-                edge_data = self.graph.get_edge(from_node, to_node)
-                if edge_data:
-                    label = edge_data.get('label')
-                    if label == self.DOMAIN_RELATION:
-                        domain.append(to_node)
-                    elif label == self.RANGE_RELATION:
-                        range_list.append(to_node)
+        domain = list(self._out_edges(self.DOMAIN_RELATION).get(property_id, ()))
+        range_list = list(self._out_edges(self.RANGE_RELATION).get(property_id, ()))
         
         # Get characteristics
         char_str = node_data.get('characteristics', '')
         characteristics = set()
         if char_str:
             for c in char_str.split(','):
-                try:
-                    characteristics.add(PropertyCharacteristic(c))
-                except ValueError:
-                    pass
+                characteristic = PROPERTY_CHARACTERISTICS_BY_VALUE.get(c)
+                if characteristic:
+                    characteristics.add(characteristic)
         
-        return OntologyProperty(
+        prop = OntologyProperty(
             id=property_id,
             label=node_data.get('label', property_id),
-            property_type=PropertyType(node_data.get('property_type', 'object')),
+            # Unrecognized stored types read back as object properties
+            property_type=PROPERTY_TYPES_BY_VALUE.get(
+                node_data.get('property_type'), PropertyType.OBJECT
+            ),
             description=node_data.get('description'),
             domain=domain,
             range=range_list,
+            parent_properties=list(self._out_edges(self.SUBPROPERTY_RELATION).get(property_id, ())),
             inverse_of=node_data.get('inverse_of') or None,
             characteristics=characteristics
         )
+        self._store_memo(self._property_cache, property_id, prop, generation)
+        return prop
     
-    def get_all_properties(self) -> List[OntologyProperty]:
-        """Get all ontology properties"""
-        properties = []
-        for node_id in self.graph.get_all_nodes():
-            node_data = self._get_node_data(node_id)
-            if node_data and node_data.get('node_type') == self.PROPERTY_TYPE:
+    def iter_properties(self, limit: Optional[int] = None, offset: int = 0) -> Iterator[OntologyProperty]:
+        """
+        Iterate ontology properties in id order, building each on demand
+        
+        Args:
+            limit: Maximum number of properties to yield
+            offset: Number of properties to skip first
+        """
+        def properties():
+            for node_id in self._ids_of_type(self.PROPERTY_TYPE):
                 try:
-                    properties.append(self.get_property(node_id))
+                    yield self.get_property(node_id)
                 except Exception as e:
                     # Log exceptions for debugging
-                    import logging
-                    logger = logging.getLogger(__name__)
                     logger.warning(f"Error getting property {node_id}: {e}")
                     continue
+        
+        stop = None if limit is None else offset + limit
+        return islice(properties(), offset, stop)
+    
+    def get_all_properties(self, limit: Optional[int] = None, offset: int = 0) -> List[OntologyProperty]:
+        """Get all ontology properties"""
+        return list(self.iter_properties(limit, offset))
+    
+    @_synchronized
+    def get_subproperties(self, property_id: str, direct_only: bool = False) -> List[OntologyProperty]:
+        """Get subproperties (rdfs:subPropertyOf descendants) of a property"""
+        if direct_only:
+            child_ids = self._in_edges(self.SUBPROPERTY_RELATION).get(property_id, ())
+        else:
+            child_ids = self._transitive_reachable(property_id, self.SUBPROPERTY_RELATION, "down")
+        
+        return self._properties_by_id(child_ids)
+    
+    @_synchronized
+    def get_superproperties(self, property_id: str, direct_only: bool = False) -> List[OntologyProperty]:
+        """Get superproperties (rdfs:subPropertyOf ancestors) of a property"""
+        if direct_only:
+            parent_ids = self._out_edges(self.SUBPROPERTY_RELATION).get(property_id, ())
+        else:
+            parent_ids = self._transitive_reachable(property_id, self.SUBPROPERTY_RELATION, "up")
+        
+        return self._properties_by_id(parent_ids)
+    
+    def _properties_by_id(self, property_ids) -> List[OntologyProperty]:
+        """Load properties by id, skipping any that can't be read"""
+        properties = []
+        for property_id in property_ids:
+            try:
+                properties.append(self.get_property(property_id))
+            except Exception:
+                continue
         return properties
     
     # ========================================================================
     # Instance Operations
     # ========================================================================
     
+    @_synchronized
     def create_instance(self, instance_obj: OntologyInstance) -> OntologyInstance:
         """Create a new instance"""
         if self.graph.node_exists(instance_obj.id):
@@ -398,21 +865,64 @@ class OntologyService:
         for class_id in instance_obj.class_ids:
             if not self.graph.node_exists(class_id):
                 raise NodeNotFoundError(f"Class '{class_id}' not found")
+        self._add_node(instance_obj.id, self._instance_node_data(instance_obj))
+        
+        # Add type relationships
+        for class_id in instance_obj.class_ids:
+            self._add_edge(instance_obj.id, class_id, self.TYPE_RELATION)
+        
+        self._invalidate_caches()
+        return instance_obj
+    
+    def _instance_node_data(self, instance_obj: OntologyInstance) -> Dict[str, Any]:
+        """Node data stored for an instance"""
         node_data = {
             "label": instance_obj.label,
             "node_type": self.INSTANCE_TYPE,
         }
         node_data.update(instance_obj.properties)
-        self.graph.add_node(instance_obj.id, data=node_data)
-        
-        # Add type relationships
-        for class_id in instance_obj.class_ids:
-            self.graph.add_edge(instance_obj.id, class_id, label=self.TYPE_RELATION)
+        return node_data
+    
+    @_synchronized
+    def create_instances_bulk(self, instance_objs: List[OntologyInstance]) -> List[OntologyInstance]:
+        """
+        Create many instances with one batched graph write
         
-        return instance_obj
+        Raises:
+            ValidationError: If an instance already exists
+            NodeNotFoundError: If a class is missing
+        """
+        existing = set(self.graph.get_all_nodes())
+        for instance_obj in instance_objs:
+            if instance_obj.id in existing:
+                raise ValidationError(f"Instance '{instance_obj.id}' already exists")
+            for class_id in instance_obj.class_ids:
+                if class_id not in existing:
+                    raise NodeNotFoundError(f"Class '{class_id}' not found")
+            existing.add(instance_obj.id)
+        
+        nodes = []
+        edges = []
+        for instance_obj in instance_objs:
+            nodes.append((instance_obj.id, self._instance_node_data(instance_obj)))
+            edges.extend((instance_obj.id, c, self.TYPE_RELATION) for c in instance_obj.class_ids)
+        
+        self._write_bulk(nodes, edges)
+        return instance_objs
     
+    @_synchronized
     def get_instance(self, instance_id: str) -> OntologyInstance:
-        """Get instance by ID"""
+        """
+        Get instance by ID
+        
+        Instances are memoized until the next mutation; treat the returned
+        object as read-only.
+        """
+        cached = self._instance_cache.get(instance_id)
+        if cached is not None:
+            return cached
+        
+        generation = self._generation
         if not self.graph.node_exists(instance_id):
             raise NodeNotFoundError(f"Instance '{instance_id}' not found")
         
@@ -422,47 +932,74 @@ class OntologyService:
             raise ValidationError(f"Node '{instance_id}' is not an instance")
         
         # Get classes
-        class_ids = []
-        edges = self.graph.get_all_edges()
-        for from_node, to_node, weight in edges:
-            if from_node == instance_id:
-                edge_data = self.graph.get_edge(from_node, to_node)
-                if edge_data and edge_data.get('label') == self.TYPE_RELATION:
-                    class_ids.append(to_node)
-        
-        return OntologyInstance(
+        class_ids = list(self._out_edges(self.TYPE_RELATION).get(instance_id, ()))
+        
+        instance = OntologyInstance(
             id=instance_id,
             label=node_data.get('label', instance_id),
             class_ids=class_ids,
             properties=node_data
         )
+        self._store_memo(self._instance_cache, instance_id, instance, generation)
+        return instance
     
-    def get_instances_of_class(self, class_id: str, direct_only: bool = True) -> List[OntologyInstance]:
-        """Get all instances of a class"""
-        instances = []
-        edges = self.graph.get_all_edges()
-        
-        target_classes = {class_id}
-        if not direct_only:
-            # Include subclasses
-            subclasses = self.get_subclasses(class_id, direct_only=False)
-            target_classes.update(sc.id for sc in subclasses)
-        
-        for from_node, to_node, weight in edges:
-            if to_node in target_classes:
-                edge_data = self.graph.get_edge(from_node, to_node)
-                if edge_data and edge_data.get('label') == self.TYPE_RELATION:
-                    try:
-                        instances.append(self.get_instance(from_node))
-                    except Exception:
-                        continue
-        
-        return instances
+    def get_instances_of_class(self, class_id: str, direct_only: bool = True,
+                               use_inference: bool = True) -> List[OntologyInstance]:
+        """
+        Get all instances of a class
+        
+        Args:
+            class_id: Class ID
+            direct_only: If False, include instances of subclasses
+            use_inference: Answer from materialize_inferences() results when
+                they are current (ignored for direct_only)
+        """
+        return list(self.iter_instances_of_class(class_id, direct_only, use_inference))
+    
+    @_synchronized
+    def iter_instances_of_class(self, class_id: str, direct_only: bool = True,
+                                use_inference: bool = True) -> Iterator[OntologyInstance]:
+        """
+        Iterate instances of a class, building each on demand
+        
+        Arguments as for get_instances_of_class. The ids are resolved up
+        front; only the instance objects are lazy.
+        """
+        inferences = self._inferences if use_inference else None
+        if direct_only:
+            instance_ids = tuple(self._in_edges(self.TYPE_RELATION).get(class_id, ()))
+        elif inferences is not None and inferences[0] == self._generation:
+            instance_ids = inferences[2].get(class_id, ())
+        else:
+            instance_ids = self._instance_ids_under(class_id)
+        
+        def instances():
+            for instance_id in instance_ids:
+                try:
+                    yield self.get_instance(instance_id)
+                except Exception:
+                    continue
+        
+        return instances()
+    
+    def _instance_ids_under(self, class_id: str) -> List[str]:
+        """Ids of instances of a class or any of its subclasses, each once"""
+        typed_by = self._in_edges(self.TYPE_RELATION)
+        target_classes = self._transitive_reachable(
+            class_id, self.SUBCLASS_RELATION, "down", include_self=True
+        )
+        
+        # One flat pass over the type index for the whole closure; dict keys
+        # drop instances typed with more than one class in it, keeping order
+        return list(dict.fromkeys(
+            chain.from_iterable(typed_by.get(target, ()) for target in target_classes)
+        ))
     
     # ========================================================================
     # Reasoning Operations
     # ========================================================================
     
+    @_synchronized
     def check_consistency(self) -> ReasoningResult:
         """
         Check ontology consistency
@@ -472,31 +1009,148 @@ class OntologyService:
         - Domain/range constraints satisfied
         - Disjoint class violations
         """
-        import time
         start_time = time.time()
         
         result = ReasoningResult(consistent=True)
         
         # Check for cycles in class hierarchy
-        def has_cycle(class_id: str, visited: Set[str]) -> bool:
-            if class_id in visited:
-                return True
-            visited.add(class_id)
-            
-            superclasses = self.get_superclasses(class_id, direct_only=True)
-            for parent in superclasses:
-                if has_cycle(parent.id, visited.copy()):
-                    return True
-            return False
+        for component in self._find_cycles_scc():
+            result.consistent = False
+            members = ", ".join(f"'{class_id}'" for class_id in sorted(component))
+            result.errors.append(f"Circular inheritance detected involving {members}")
         
-        for class_obj in self.get_all_classes():
-            if has_cycle(class_obj.id, set()):
-                result.consistent = False
-                result.errors.append(f"Circular inheritance detected involving '{class_obj.id}'")
+        result.reasoning_time = time.time() - start_time
+        return result
+    
+    @_synchronized
+    def snapshot(self) -> 'OntologySnapshot':
+        """
+        Get a read-only snapshot of the current ontology
+        
+        Repeated calls between mutations return the same snapshot.
+        """
+        if self._snapshot is None or not self._snapshot.is_current:
+            self._snapshot = OntologySnapshot(self)
+        return self._snapshot
+    
+    @property
+    def inferences_stale(self) -> bool:
+        """True if the ontology changed since materialize_inferences() last ran"""
+        inferences = self._inferences
+        return inferences is None or inferences[0] != self._generation
+    
+    @_synchronized
+    def materialize_inferences(self) -> ReasoningResult:
+        """
+        Forward-chain the subclass and type closures
+        
+        Computes every class's superclasses and every instance's classes
+        (asserted and inherited) up front and keeps them until the next
+        mutation, so read-heavy callers get transitive answers as lookups.
+        Inferred facts stay in memory rather than being written as graph
+        edges, so asserted relations (parent_classes, class_ids) are
+        unaffected.
+        
+        Returns:
+            ReasoningResult with subclass_closure (class -> all superclasses),
+            inferred_types (instance -> all classes) and the entailed
+            triples that weren't asserted
+        """
+        start_time = time.time()
+        generation = self._generation
+        
+        result = ReasoningResult(consistent=not self._find_cycles_scc())
+        parents_of = self._out_edges(self.SUBCLASS_RELATION)
+        
+        class_ids = self._ids_of_type(self.CLASS_TYPE)
+        for class_id in class_ids:
+            ancestors = self._transitive_reachable(class_id, self.SUBCLASS_RELATION, "up")
+            result.subclass_closure[class_id] = set(ancestors)
+            asserted = parents_of.get(class_id, ())
+            result.inferred_relationships.extend(
+                {"subject": class_id, "predicate": self.SUBCLASS_RELATION, "object": a}
+                for a in ancestors if a not in asserted
+            )
+        
+        for instance_id, asserted in self._out_edges(self.TYPE_RELATION).items():
+            types = []
+            for class_id in asserted:
+                for type_id in self._transitive_reachable(
+                    class_id, self.SUBCLASS_RELATION, "up", include_self=True
+                ):
+                    if type_id not in types:
+                        types.append(type_id)
+            result.inferred_types[instance_id] = types
+            result.inferred_relationships.extend(
+                {"subject": instance_id, "predicate": self.TYPE_RELATION, "object": t}
+                for t in types if t not in asserted
+            )
+        
+        members = {
+            class_id: tuple(self._instance_ids_under(class_id)) for class_id in class_ids
+        }
+        # Tagged with the generation it was computed from, so a run that
+        # raced a mutation is published already stale
+        self._inferences = (generation, result, members)
         
         result.reasoning_time = time.time() - start_time
         return result
     
+    def _find_cycles_scc(self) -> List[List[str]]:
+        """
+        Find subclass cycles as strongly connected components
+        
+        Iterative Tarjan over the subclass index, so deep hierarchies can't
+        hit the recursion limit. Returns every component of more than one
+        class, plus single classes that are their own parent.
+        """
+        parents_of = self._out_edges(self.SUBCLASS_RELATION)
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        cycles: List[List[str]] = []
+        work: List[Tuple[str, Any]] = []  # DFS frames: (node, iterator over its parents)
+        
+        def visit(node: str):
+            index[node] = lowlink[node] = len(index)
+            stack.append(node)
+            on_stack.add(node)
+            work.append((node, iter(parents_of.get(node, ()))))
+        
+        for root in parents_of:
+            if root in index:
+                continue
+            visit(root)
+            
+            while work:
+                node, parents = work[-1]
+                for parent in parents:
+                    if parent not in index:
+                        visit(parent)
+                        break
+                    if parent in on_stack:
+                        lowlink[node] = min(lowlink[node], index[parent])
+                else:
+                    # All parents done: propagate lowlink, pop a finished component
+                    work.pop()
+                    if work:
+                        caller = work[-1][0]
+                        lowlink[caller] = min(lowlink[caller], lowlink[node])
+                    
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in parents_of.get(node, ()):
+                            cycles.append(component)
+        
+        return cycles
+    
     # ========================================================================
     # Property Inheritance & Reasoning
     # ========================================================================
@@ -511,30 +1165,49 @@ class OntologyService:
         Returns:
             List of property definitions with metadata
         """
-        properties = []
-        all_props = self.get_all_properties()
-        
-        for prop in all_props:
-            if class_id in prop.domain:
-                properties.append({
-                    'id': prop.id,
-                    'label': prop.label,
-                    'property_type': prop.property_type.value,
-                    'description': prop.description,
-                    'range': prop.range,
-                    'required': False,  # Default - can be enhanced later
-                    'source': 'direct'
-                })
-        
-        return properties
+        return [
+            self._property_entry(prop, 'direct')
+            for prop in self._properties_by_domain().get(class_id, ())
+        ]
+    
+    def _properties_by_domain(self) -> Dict[str, List[OntologyProperty]]:
+        """Properties grouped by domain class, from one sweep kept until the next mutation"""
+        by_domain = self._props_by_domain
+        if by_domain is None:
+            generation = self._generation
+            by_domain = {}
+            for prop in self.iter_properties():
+                for domain_class in prop.domain:
+                    by_domain.setdefault(domain_class, []).append(prop)
+            self._props_by_domain = by_domain
+            if self._generation != generation:
+                self._props_by_domain = None
+        return by_domain
+    
+    @staticmethod
+    def _property_entry(prop: OntologyProperty, source: str) -> Dict[str, Any]:
+        """Property definition as listed on a class"""
+        return {
+            'id': prop.id,
+            'label': prop.label,
+            'property_type': prop.property_type.value,
+            'description': prop.description,
+            'range': prop.range,
+            'required': False,  # Default - can be enhanced later
+            'source': source
+        }
     
+    @_synchronized
     def compute_inherited_properties(
         self, 
         class_id: str, 
         visited: Optional[Set[str]] = None
     ) -> List[Dict[str, Any]]:
         """
-        Recursively compute all inherited properties from parent classes
+        Compute all inherited properties from ancestor classes
+        
+        Each property is listed once, attributed to the nearest ancestor
+        declaring it. Top-level results are memoized until the next mutation.
         
         Args:
             class_id: Class ID to compute inheritance for
@@ -543,52 +1216,73 @@ class OntologyService:
         Returns:
             List of inherited property definitions with source tracking
         """
-        if visited is None:
-            visited = set()
+        if visited is not None:
+            return self._walk_class_properties(class_id, visited)[1]
         
-        # Prevent circular inheritance
-        if class_id in visited:
-            return []
+        cached = self._inherited_props_cache.get(class_id)
+        if cached is None:
+            generation = self._generation
+            cached = self._walk_class_properties(class_id, set())[1]
+            self._store_memo(self._inherited_props_cache, class_id, cached, generation)
+        
+        return [dict(prop, inheritance_path=list(prop['inheritance_path'])) for prop in cached]
+    
+    def _walk_class_properties(
+        self,
+        class_id: str,
+        visited: Set[str]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Direct and inherited properties of a class in one breadth-first walk
         
+        Ancestors are visited nearest first, each once, skipping classes
+        already in visited; owl:Thing contributes nothing. A property
+        declared on several classes is kept from the nearest one.
+        
+        Returns:
+            (direct properties, inherited properties)
+        """
+        # Prevent circular inheritance
+        if class_id in visited or not self.graph.node_exists(class_id):
+            return [], []
         visited.add(class_id)
         
-        try:
-            class_obj = self.get_class(class_id)
-        except NodeNotFoundError:
-            return []
+        by_domain = self._properties_by_domain()
+        parents_of = self._out_edges(self.SUBCLASS_RELATION)
+        seen_props: Set[str] = set()
         
-        inherited = []
+        direct = []
+        for prop in by_domain.get(class_id, ()):
+            seen_props.add(prop.id)
+            direct.append(self._property_entry(prop, 'direct'))
         
-        # Process each parent class
-        for parent_id in class_obj.parent_classes:
+        inherited = []
+        queue = deque((parent_id, []) for parent_id in parents_of.get(class_id, ()))
+        while queue:
+            ancestor_id, path = queue.popleft()
+            
             # Skip owl:Thing as it has no meaningful properties
-            if parent_id == "owl:Thing":
+            if ancestor_id in visited or ancestor_id == "owl:Thing":
                 continue
-            
-            try:
-                parent_class = self.get_class(parent_id)
-                
-                # Get parent's direct properties
-                parent_props = self.get_class_properties(parent_id)
-                for prop in parent_props:
-                    prop_copy = prop.copy()
-                    prop_copy['source'] = parent_class.label
-                    prop_copy['inheritance_path'] = [parent_class.label]
-                    inherited.append(prop_copy)
-                
-                # Recursively get grandparent properties
-                grandparent_props = self.compute_inherited_properties(parent_id, visited)
-                for prop in grandparent_props:
-                    prop_copy = prop.copy()
-                    # Update inheritance path
-                    prop_copy['inheritance_path'] = [parent_class.label] + prop_copy.get('inheritance_path', [])
-                    inherited.append(prop_copy)
-                    
-            except NodeNotFoundError:
+            visited.add(ancestor_id)
+            if not self.graph.node_exists(ancestor_id):
                 continue
+            
+            label = self._get_node_data(ancestor_id).get('label', ancestor_id)
+            path = path + [label]
+            
+            for prop in by_domain.get(ancestor_id, ()):
+                if prop.id not in seen_props:
+                    seen_props.add(prop.id)
+                    entry = self._property_entry(prop, label)
+                    entry['inheritance_path'] = path
+                    inherited.append(entry)
+            
+            queue.extend((parent_id, path) for parent_id in parents_of.get(ancestor_id, ()))
         
-        return inherited
+        return direct, inherited
     
+    @_synchronized
     def get_class_full(self, class_id: str) -> Dict[str, Any]:
         """
         Get complete class information including inherited properties
@@ -597,20 +1291,20 @@ class OntologyService:
             class_id: Class ID
             
         Returns:
-            Dictionary with full class details including direct and inherited properties
+            Dictionary with full class details including direct and inherited
+            properties (memoized until the next mutation; treat as read-only)
         """
-        class_obj = self.get_class(class_id)
-        
-        # Get direct properties
-        direct_properties = self.get_class_properties(class_id)
+        cached = self._class_full_cache.get(class_id)
+        if cached is not None:
+            return cached
         
-        # Get inherited properties
-        inherited_properties = self.compute_inherited_properties(class_id)
+        generation = self._generation
+        class_obj = self.get_class(class_id)
         
-        # Combine all properties
-        all_properties = direct_properties + inherited_properties
+        # Direct and inherited properties in one walk up the hierarchy
+        direct_properties, inherited_properties = self._walk_class_properties(class_id, set())
         
-        return {
+        class_full = {
             'id': class_obj.id,
             'label': class_obj.label,
             'description': class_obj.description,
@@ -618,8 +1312,26 @@ class OntologyService:
             'is_abstract': class_obj.is_abstract,
             'direct_properties': direct_properties,
             'inherited_properties': inherited_properties,
-            'all_properties': all_properties
+            'all_properties': direct_properties + inherited_properties
         }
+        self._store_memo(self._class_full_cache, class_id, class_full, generation)
+        return class_full
+    
+    def _get_required_properties(self, class_id: str) -> List[Dict[str, Any]]:
+        """Get required properties of a class (direct + inherited), memoized"""
+        required = self._required_props_cache.get(class_id)
+        if required is None:
+            generation = self._generation
+            class_full = self.get_class_full(class_id)
+            required = [p for p in class_full['all_properties'] if p.get('required', False)]
+            self._store_memo(self._required_props_cache, class_id, required, generation)
+        return required
+    
+    @staticmethod
+    def _missing_property_error(prop: Dict[str, Any]) -> str:
+        """Format the validation error for a missing required property"""
+        source_info = f" (inherited from {prop['source']})" if prop['source'] != 'direct' else ""
+        return f"Missing required property '{prop['label']}'{source_info}"
     
     def validate_instance_properties(
         self, 
@@ -638,64 +1350,106 @@ class OntologyService:
         """
         errors = []
         
-        # Get all properties (direct + inherited)
-        class_full = self.get_class_full(class_id)
-        all_props = class_full['all_properties']
-        
         # Check required properties
-        for prop in all_props:
-            if prop.get('required', False):
-                prop_name = prop['id']
-                if prop_name not in properties or properties[prop_name] is None:
-                    source_info = f" (inherited from {prop['source']})" if prop['source'] != 'direct' else ""
-                    errors.append(
-                        f"Missing required property '{prop['label']}'{source_info}"
-                    )
+        for prop in self._get_required_properties(class_id):
+            prop_name = prop['id']
+            if prop_name not in properties or properties[prop_name] is None:
+                errors.append(self._missing_property_error(prop))
         
         # Type validation can be added here in future
         # For now, we just check required fields
         
         return errors
     
+    def validate_instance_properties_multi(
+        self,
+        class_ids: List[str],
+        properties: Dict[str, Any]
+    ) -> List[str]:
+        """
+        Validate instance properties against the union of several classes' requirements
+        
+        A property required by more than one class (e.g. inherited from a
+        shared ancestor) is checked and reported once. A class whose
+        requirements can't be read is logged and skipped; the others are
+        still checked.
+        
+        Args:
+            class_ids: Classes the instance belongs to
+            properties: Property values to validate
+            
+        Returns:
+            List of validation error messages (empty if valid)
+        """
+        errors = []
+        checked = set()
+        
+        for class_id in class_ids:
+            try:
+                required = self._get_required_properties(class_id)
+            except Exception as e:
+                logger.warning(f"Could not validate against class {class_id}: {e}")
+                continue
+            for prop in required:
+                prop_name = prop['id']
+                if prop_name in checked:
+                    continue
+                checked.add(prop_name)
+                if prop_name not in properties or properties[prop_name] is None:
+                    errors.append(self._missing_property_error(prop))
+        
+        return errors
+    
+    @_synchronized
     def get_statistics(self) -> OntologyStats:
         """Get ontology statistics"""
-        all_classes = self.get_all_classes()
-        all_properties = self.get_all_properties()
+        # One copy of each type set, so counts and depths agree
+        class_ids = tuple(self._nodes_by_type[self.CLASS_TYPE])
+        property_ids = tuple(self._nodes_by_type[self.PROPERTY_TYPE])
+        props_by_type = {t: 0 for t in PropertyType}
         
-        # Count instances
-        total_instances = 0
-        for node_id in self.graph.get_all_nodes():
-            node_data = self._get_node_data(node_id)
-            if node_data and node_data.get('node_type') == self.INSTANCE_TYPE:
-                total_instances += 1
-        
-        # Count by property type
-        obj_props = sum(1 for p in all_properties if p.property_type == PropertyType.OBJECT)
-        data_props = sum(1 for p in all_properties if p.property_type == PropertyType.DATA)
-        annot_props = sum(1 for p in all_properties if p.property_type == PropertyType.ANNOTATION)
-        
-        # Calculate max hierarchy depth
-        def get_depth(class_id: str) -> int:
-            superclasses = self.get_superclasses(class_id, direct_only=True)
-            if not superclasses:
-                return 0
-            return 1 + max(get_depth(sc.id) for sc in superclasses)
-        
-        max_depth = 0
-        for class_obj in all_classes:
-            depth = get_depth(class_obj.id)
-            max_depth = max(max_depth, depth)
+        # Only properties need their node data read; types resolve as in get_property
+        for node_id in property_ids:
+            stored_type = self._get_node_data(node_id).get('property_type')
+            props_by_type[PROPERTY_TYPES_BY_VALUE.get(stored_type, PropertyType.OBJECT)] += 1
         
         return OntologyStats(
-            total_classes=len(all_classes),
-            total_properties=len(all_properties),
-            total_instances=total_instances,
-            total_object_properties=obj_props,
-            total_data_properties=data_props,
-            total_annotation_properties=annot_props,
-            max_hierarchy_depth=max_depth
+            total_classes=len(class_ids),
+            total_properties=len(property_ids),
+            total_instances=len(self._nodes_by_type[self.INSTANCE_TYPE]),
+            total_object_properties=props_by_type[PropertyType.OBJECT],
+            total_data_properties=props_by_type[PropertyType.DATA],
+            total_annotation_properties=props_by_type[PropertyType.ANNOTATION],
+            max_hierarchy_depth=max(self._class_depths(class_ids).values(), default=0)
         )
     
+    def _class_depths(self, class_ids: Tuple[str, ...]) -> Dict[str, int]:
+        """
+        Longest subclass path from each class up to a root
+        
+        Kahn's topological order over the subclass DAG, relaxing
+        depth[child] = max(depth[parent] + 1) as each parent is settled.
+        Classes on a cycle are never settled and get no depth.
+        """
+        parents_of = self._out_edges(self.SUBCLASS_RELATION)
+        children_of = self._in_edges(self.SUBCLASS_RELATION)
+        
+        pending = {c: len(parents_of.get(c, ())) for c in class_ids}
+        depths = {c: 0 for c, count in pending.items() if count == 0}
+        queue = deque(depths)
+        
+        while queue:
+            parent = queue.popleft()
+            for child in children_of.get(parent, ()):
+                if child not in pending:
+                    continue
+                depths[child] = max(depths.get(child, 0), depths[parent] + 1)
+                pending[child] -= 1
+                if pending[child] == 0:
+                    queue.append(child)
+        
+        return {c: depths[c] for c, count in pending.items() if count == 0}
+    
     def validate_ontology(self) -> ValidationResult:
         """Validate entire ontology structure"""
         result = ValidationResult(valid=True)
@@ -707,7 +1461,7 @@ class OntologyService:
                 result.add_error(error, error_type="consistency")
 
         # Check for orphan classes (no parent except owl:Thing)
-        for class_obj in self.get_all_classes():
+        for class_obj in self.iter_classes():
             if class_obj.id != "owl:Thing":
                 if not class_obj.parent_classes:
                     result.add_warning(
@@ -748,7 +1502,7 @@ class OntologyService:
         g.add((ONT.Ontology, RDF.type, OWL.Ontology))
 
         # Export classes
-        for class_obj in self.get_all_classes():
+        for class_obj in self.iter_classes():
             class_uri = ONT[class_obj.id.replace(":", "_")]
             g.add((class_uri, RDF.type, OWL.Class))
 
@@ -764,7 +1518,7 @@ class OntologyService:
                 g.add((class_uri, RDFS.subClassOf, parent_uri))
 
         # Export properties
-        for prop in self.get_all_properties():
+        for prop in self.iter_properties():
             prop_uri = ONT[prop.id.replace(":", "_")]
 
             if prop.property_type == PropertyType.OBJECT:
@@ -790,29 +1544,26 @@ class OntologyService:
                 g.add((prop_uri, RDFS.range, range_uri))
 
         # Export instances
-        all_node_ids = self.graph.get_all_nodes()
-        for node_id in all_node_ids:
-            node_data = self._get_node_data(node_id)
-            if node_data and node_data.get('node_type') == self.INSTANCE_TYPE:
-                try:
-                    instance = self.get_instance(node_id)
-                    instance_uri = ONT[instance.id.replace(":", "_")]
+        for node_id in self._ids_of_type(self.INSTANCE_TYPE):
+            try:
+                instance = self.get_instance(node_id)
+                instance_uri = ONT[instance.id.replace(":", "_")]
 
-                    # Add type assertions
-                    for class_id in instance.class_ids:
-                        class_uri = ONT[class_id.replace(":", "_")]
-                        g.add((instance_uri, RDF.type, class_uri))
+                # Add type assertions
+                for class_id in instance.class_ids:
+                    class_uri = ONT[class_id.replace(":", "_")]
+                    g.add((instance_uri, RDF.type, class_uri))
 
-                    if instance.label:
-                        g.add((instance_uri, RDFS.label, Literal(instance.label)))
+                if instance.label:
+                    g.add((instance_uri, RDFS.label, Literal(instance.label)))
 
-                    # Add property values
-                    for prop_id, value in instance.properties.items():
-                        prop_uri = ONT[prop_id.replace(":", "_")]
-                        g.add((instance_uri, prop_uri, Literal(value)))
-                except Exception as e:
-                    # Skip instances that can't be serialized
-                    pass
+                # Add property values
+                for prop_id, value in instance.properties.items():
+                    prop_uri = ONT[prop_id.replace(":", "_")]
+                    g.add((instance_uri, prop_uri, Literal(value)))
+            except Exception as e:
+                # Skip instances that can't be serialized
+                pass
 
         # Serialize to requested format
         format_map = {
@@ -826,6 +1577,7 @@ class OntologyService:
 
         return g.serialize(format=rdf_format)
 
+    @_synchronized
     def import_from_rdf(self, rdf_content: str, format: str = "xml", clear_existing: bool = False) -> Dict[str, int]:
         """
         Import ontology from RDF format
@@ -967,3 +1719,84 @@ class OntologyService:
                 print(f"Error importing data property {prop_uri}: {e}")
 
         return counts
+
+
+class OntologySnapshot:
+    """
+    Read-only view of an ontology at one point in time
+    
+    Classes, type membership and subclass closures are computed once when
+    the snapshot is taken, so back-to-back reads are dict lookups. Any
+    later mutation of the service makes the snapshot stale; reading from
+    a stale snapshot raises InvalidOperationError. Returned objects are
+    shared; treat them as read-only.
+    """
+    
+    def __init__(self, service: OntologyService):
+        self._service = service
+        self.version = service._generation
+        
+        subclass = service.SUBCLASS_RELATION
+        children_of = service._in_edges(subclass)
+        
+        class_ids = service._ids_of_type(service.CLASS_TYPE)
+        self.classes: Dict[str, OntologyClass] = {
+            c.id: c for c in service._classes_by_id(class_ids)
+        }
+        self.property_ids = frozenset(service._nodes_by_type[service.PROPERTY_TYPE])
+        self.instance_ids = frozenset(service._nodes_by_type[service.INSTANCE_TYPE])
+        
+        self._children = {c: tuple(children_of.get(c, ())) for c in self.classes}
+        self._descendants = {
+            c: service._transitive_reachable(c, subclass, "down") for c in self.classes
+        }
+        self._ancestors = {
+            c: service._transitive_reachable(c, subclass, "up") for c in self.classes
+        }
+    
+    @property
+    def is_current(self) -> bool:
+        """True until the service is next mutated"""
+        return self._service._generation == self.version
+    
+    def _check_current(self):
+        if not self.is_current:
+            raise InvalidOperationError("Ontology changed since this snapshot was taken")
+    
+    def _classes(self, class_ids) -> List[OntologyClass]:
+        return [self.classes[c] for c in class_ids if c in self.classes]
+    
+    def get_class(self, class_id: str) -> OntologyClass:
+        """Get class by ID"""
+        self._check_current()
+        try:
+            return self.classes[class_id]
+        except KeyError:
+            raise NodeNotFoundError(f"Class '{class_id}' not found") from None
+    
+    def get_subclasses(self, class_id: str, direct_only: bool = False) -> List[OntologyClass]:
+        """Get subclasses of a class"""
+        self._check_current()
+        if direct_only:
+            return self._classes(self._children.get(class_id, ()))
+        return self._classes(self._descendants.get(class_id, ()))
+    
+    def get_superclasses(self, class_id: str, direct_only: bool = False) -> List[OntologyClass]:
+        """Get superclasses (ancestors) of a class"""
+        self._check_current()
+        if direct_only:
+            class_obj = self.classes.get(class_id)
+            return self._classes(class_obj.parent_classes) if class_obj else []
+        return self._classes(self._ancestors.get(class_id, ()))
+    
+    def get_class_full(self, class_id: str) -> Dict[str, Any]:
+        """Get complete class information including inherited properties"""
+        self._check_current()
+        # The service memoizes these until the next mutation, which is
+        # exactly the snapshot's lifetime
+        return self._service.get_class_full(class_id)
+    
+    def get_instances_of_class(self, class_id: str, direct_only: bool = True) -> List[OntologyInstance]:
+        """Get all instances of a class"""
+        self._check_current()
+        return self._service.get_instances_of_class(class_id, direct_only=direct_only)
@@ -36,4 +36,4 @@ export PYTHONPATH="$(pwd):$PYTHONPATH"
 # Start the server
 echo "Starting server on http://localhost:5002..."
 echo ""
-python3 ontology_api.py
+python3 ontology_api.py --dev
@@ -0,0 +1,170 @@
+"""
+Unit tests for the Ontology Editor API
+
+Covers the response cache and its ETags, streamed list bodies and the
+pre-serialized error/message responses, using Flask's test client
+against a fresh service per test.
+"""
+
+import orjson
+import pytest
+
+import ontology_api
+from src.services.ontology_service import OntologyService
+from src.services.ontology_models import OntologyClass, OntologyInstance
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Service with Animal -> {Dog, Cat, Bird} and one instance, installed as the app's"""
+    service = OntologyService()
+    service.create_class(OntologyClass(id="Animal", label="Animal"))
+    for class_id in ("Dog", "Cat", "Bird"):
+        service.create_class(OntologyClass(id=class_id, label=class_id, parent_classes=["Animal"]))
+    service.create_instance(OntologyInstance(id="rex", label="Rex", class_ids=["Dog"]))
+    
+    monkeypatch.setattr(ontology_api, "ontology_service", service)
+    ontology_api.invalidate_response_cache()
+    return service
+
+
+@pytest.fixture
+def client(service):
+    """Flask test client for the app"""
+    return ontology_api.app.test_client()
+
+
+def _body(response):
+    """Parse a response body"""
+    return orjson.loads(response.get_data())
+
+
+class TestResponseCache:
+    """Test cached read endpoints"""
+    
+    def test_hit_served_from_cache(self, client, service, monkeypatch):
+        """Test a repeated read doesn't reach the service"""
+        first = client.get('/api/ontology/classes')
+        monkeypatch.setattr(service, "get_all_classes_columnar", lambda: pytest.fail("cache missed"))
+        second = client.get('/api/ontology/classes')
+        
+        assert second.status_code == 200
+        assert second.get_data() == first.get_data()
+    
+    def test_write_invalidates(self, client):
+        """Test a created class shows up in the next read"""
+        before = client.get('/api/ontology/classes')
+        client.post('/api/ontology/classes', json={"id": "Fish", "parent_classes": ["Animal"]})
+        after = client.get('/api/ontology/classes')
+        
+        assert "Fish" in [c['id'] for c in _body(after)['data']]
+        assert after.headers['ETag'] != before.headers['ETag']
+    
+    def test_unread_args_share_an_entry(self, client):
+        """Test query args an endpoint doesn't read don't add cache entries"""
+        for n in range(5):
+            client.get(f'/api/ontology/classes?junk={n}')
+        client.get('/api/ontology/hierarchy?root=Animal')
+        
+        assert len(ontology_api._resp_cache) == 2
+    
+    def test_not_modified(self, client):
+        """Test a matching If-None-Match gets a 304 with the same validators and policy"""
+        first = client.get('/api/ontology/classes')
+        etag = first.headers['ETag']
+        
+        second = client.get('/api/ontology/classes', headers={'If-None-Match': etag})
+        
+        assert etag.startswith('W/')
+        assert second.status_code == 304
+        assert second.get_data() == b''
+        assert second.headers['ETag'] == etag
+        assert second.headers['Cache-Control'] == first.headers['Cache-Control'] == \
+            'private, max-age=0, must-revalidate'
+
+
+class TestListBodies:
+    """Test buffered and streamed list payloads"""
+    
+    def test_classes_shape(self, client, service):
+        """Test /classes has the success envelope with one row per class object"""
+        body = _body(client.get('/api/ontology/classes'))
+        
+        assert set(body) == {"success", "message", "data", "timestamp"}
+        assert body['success'] is True
+        assert body['data'] == [
+            {
+                "id": c.id,
+                "label": c.label,
+                "description": c.description,
+                "parent_classes": c.parent_classes,
+                "is_abstract": c.is_abstract
+            } for c in service.get_all_classes()
+        ]
+    
+    def test_streamed_subclasses_parse(self, client, service, monkeypatch):
+        """Test a streamed body spanning several chunks is one JSON document"""
+        monkeypatch.setattr(ontology_api, "_STREAM_CHUNK_ROWS", 2)
+        
+        response = client.get('/api/ontology/classes/Animal/subclasses', buffered=False)
+        chunks = list(response.response)
+        body = orjson.loads(b''.join(chunks))
+        
+        # Envelope head, two chunks of rows, envelope tail
+        assert len(chunks) == 4
+        assert set(body) == {"success", "message", "data", "timestamp"}
+        assert body['success'] is True and body['message'] == "Success"
+        assert body['data'] == [
+            {"id": c.id, "label": c.label, "description": c.description}
+            for c in service.get_subclasses("Animal")
+        ]
+        assert [row['id'] for row in body['data']] == ["Dog", "Cat", "Bird"]
+    
+    def test_streamed_instances(self, client):
+        """Test the streamed instance list carries the instance rows"""
+        body = _body(client.get('/api/ontology/classes/Animal/instances?direct=false'))
+        
+        assert body['data'] == [{"id": "rex", "label": "Rex", "class_ids": ["Dog"]}]
+
+
+class TestTemplatedResponses:
+    """Test error and message bodies and request parsing"""
+    
+    def test_malformed_json_rejected(self, client):
+        """Test an unparseable body is a 400 error, not a 500"""
+        response = client.post('/api/ontology/classes', data=b'{"id": ',
+                               content_type='application/json')
+        body = _body(response)
+        
+        assert response.status_code == 400
+        assert body['success'] is False
+        assert body['error'].startswith("Invalid JSON body")
+        assert set(body) == {"success", "error", "timestamp"}
+    
+    @pytest.mark.parametrize("fields", [
+        {"property_type": ["data"]},
+        {"property_type": {"value": "data"}},
+        {"characteristics": [["symmetric"]]},
+        {"characteristics": "symmetric"},
+    ])
+    def test_non_string_property_values_rejected(self, client, fields):
+        """Test malformed property_type or characteristics are a 400, not a 500"""
+        response = client.post('/api/ontology/properties', json={"id": "hasAge", **fields})
+        
+        assert response.status_code == 400
+        assert _body(response)['success'] is False
+    
+    def test_not_found_error(self, client):
+        """Test a missing class is reported through the error template"""
+        response = client.get('/api/ontology/classes/Unicorn')
+        
+        assert response.status_code == 404
+        assert "Unicorn" in _body(response)['error']
+    
+    def test_message_response(self, client):
+        """Test a delete answers with the message template and null data"""
+        body = _body(client.delete('/api/ontology/classes/Bird'))
+        
+        assert body['success'] is True
+        assert body['message'] == "Class 'Bird' deleted"
+        assert body['data'] is None
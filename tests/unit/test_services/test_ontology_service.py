@@ -0,0 +1,585 @@
+"""
+Unit Tests for OntologyService
+
+Covers class/property/instance queries and the derived data the service
+keeps between mutations.
+"""
+
+import sys
+import threading
+
+import pytest
+from src.services.ontology_service import OntologyService
+from src.services.ontology_models import (
+    OntologyClass,
+    OntologyProperty,
+    OntologyInstance,
+    PropertyType,
+    PropertyCharacteristic,
+)
+from src.services.base_service import NodeNotFoundError, InvalidOperationError
+
+
+@pytest.fixture
+def service():
+    """Ontology with Animal -> Mammal -> {Dog, Cat}, one property and two instances"""
+    service = OntologyService()
+    service.create_class(OntologyClass(id="Animal", label="Animal", description="Any animal"))
+    service.create_class(OntologyClass(id="Mammal", label="Mammal", parent_classes=["Animal"]))
+    service.create_class(OntologyClass(id="Dog", label="Dog", parent_classes=["Mammal"]))
+    service.create_class(OntologyClass(id="Cat", label="Cat", parent_classes=["Mammal"]))
+    service.create_property(OntologyProperty(
+        id="hasName",
+        label="name",
+        property_type=PropertyType.DATA,
+        domain=["Animal"],
+        range=["string"]
+    ))
+    service.create_instance(OntologyInstance(id="rex", label="Rex", class_ids=["Dog"]))
+    service.create_instance(OntologyInstance(id="tom", label="Tom", class_ids=["Cat"]))
+    return service
+
+
+class TestClassQueries:
+    """Test class listing and lookup"""
+    
+    def test_columnar_classes_match_class_objects(self, service):
+        """Test columnar listing has the same rows as get_all_classes"""
+        columns = service.get_all_classes_columnar()
+        rows = [dict(zip(columns, row)) for row in zip(*columns.values())]
+        
+        expected = [
+            {
+                "id": c.id,
+                "label": c.label,
+                "description": c.description,
+                "parent_classes": c.parent_classes,
+                "is_abstract": c.is_abstract,
+            }
+            for c in service.get_all_classes()
+        ]
+        assert rows == expected
+    
+    def test_class_pages(self, service):
+        """Test limit/offset slice the id-ordered class listing"""
+        all_ids = [c.id for c in service.get_all_classes()]
+        assert all_ids == ["Animal", "Cat", "Dog", "Mammal", "owl:Thing"]
+        
+        assert [c.id for c in service.get_all_classes(limit=2, offset=1)] == ["Cat", "Dog"]
+        assert [c.id for c in service.iter_classes(offset=4)] == ["owl:Thing"]
+        assert [p.id for p in service.iter_properties(limit=1)] == ["hasName"]
+    
+    def test_prefixed_ids_resolve_edges(self, service):
+        """Test edges between colon-prefixed ids are found"""
+        service.create_class(OntologyClass(id="demo:Person", label="Person"))
+        service.create_class(OntologyClass(
+            id="demo:Student", label="Student", parent_classes=["demo:Person"]
+        ))
+        service.create_instance(OntologyInstance(
+            id="demo:alice", label="Alice", class_ids=["demo:Student"]
+        ))
+        
+        assert service.get_class("demo:Student").parent_classes == ["demo:Person"]
+        assert [c.id for c in service.get_subclasses("demo:Person")] == ["demo:Student"]
+        assert service.get_instance("demo:alice").class_ids == ["demo:Student"]
+    
+    def test_deleted_class_drops_edges(self, service):
+        """Test deleting a class removes it from subclass and instance lookups"""
+        service.delete_class("Dog", force=True)
+        
+        assert [c.id for c in service.get_subclasses("Mammal")] == ["Cat"]
+        assert [i.id for i in service.get_instances_of_class("Mammal", direct_only=False)] == ["tom"]
+        assert [c.id for c in service.get_all_classes()] == ["Animal", "Cat", "Mammal", "owl:Thing"]
+        assert service.get_statistics().total_classes == 4
+    
+    def test_indirect_subclasses_listed_once(self, service):
+        """Test a class reachable along two paths appears once"""
+        service.create_class(OntologyClass(id="Pet", label="Pet", parent_classes=["Animal"]))
+        service.create_class(OntologyClass(
+            id="Puppy", label="Puppy", parent_classes=["Dog", "Pet"]
+        ))
+        
+        ids = [c.id for c in service.get_subclasses("Animal")]
+        assert sorted(ids) == ["Cat", "Dog", "Mammal", "Pet", "Puppy"]
+        assert [c.id for c in service.get_superclasses("Puppy")].count("Animal") == 1
+    
+    def test_hierarchy_structure(self, service):
+        """Test hierarchy nodes carry depth, parent and instance counts in index order"""
+        mammal = service.get_class_hierarchy("Animal").children[0]
+        
+        assert (mammal.class_id, mammal.parent_id, mammal.depth) == ("Mammal", "Animal", 1)
+        assert [(c.class_id, c.depth, c.instance_count) for c in mammal.children] == [
+            ("Dog", 2, 1), ("Cat", 2, 1)
+        ]
+    
+    def test_deep_hierarchy_beyond_recursion_limit(self, service):
+        """Test a hierarchy deeper than the recursion limit is built"""
+        depth = sys.getrecursionlimit() + 100
+        service.create_classes_bulk([
+            OntologyClass(id=f"C{i}", label=f"C{i}", parent_classes=[f"C{i - 1}"] if i else [])
+            for i in range(depth)
+        ])
+        
+        node = service.get_class_hierarchy("C0")
+        while node.children:
+            node = node.children[0]
+        
+        assert (node.class_id, node.depth) == (f"C{depth - 1}", depth - 1)
+    
+    def test_hierarchy_cycle_cut(self, service):
+        """Test a subclass cycle ends the branch instead of looping"""
+        service.graph.add_edge("Animal", "Dog", label=service.SUBCLASS_RELATION)
+        service.refresh_indexes()
+        
+        mammal = service.get_class_hierarchy("Animal").children[0]
+        dog = next(c for c in mammal.children if c.class_id == "Dog")
+        assert dog.children == []
+    
+    def test_iterators_build_objects_lazily(self, service, monkeypatch):
+        """Test iter_subclasses resolves ids up front but loads classes on demand"""
+        loaded = []
+        get_class = service.get_class
+        monkeypatch.setattr(service, "get_class", lambda class_id: loaded.append(class_id) or get_class(class_id))
+        
+        subclasses = service.iter_subclasses("Animal")
+        assert loaded == []
+        assert next(subclasses).id == "Mammal"
+        assert loaded == ["Mammal"]
+        assert [c.id for c in subclasses] == ["Dog", "Cat"]
+    
+    def test_iterators_match_lists(self, service):
+        """Test the iter_* variants yield what the list methods return"""
+        for direct_only in (True, False):
+            assert list(service.iter_subclasses("Animal", direct_only)) == service.get_subclasses("Animal", direct_only)
+            assert list(service.iter_superclasses("Dog", direct_only)) == service.get_superclasses("Dog", direct_only)
+            assert (list(service.iter_instances_of_class("Mammal", direct_only))
+                    == service.get_instances_of_class("Mammal", direct_only))
+
+
+class TestPropertyQueries:
+    """Test property lookup"""
+    
+    def test_characteristics_round_trip(self, service):
+        """Test characteristics are parsed back from node data"""
+        service.create_property(OntologyProperty(
+            id="hasParent",
+            label="parent",
+            property_type=PropertyType.OBJECT,
+            characteristics={PropertyCharacteristic.IRREFLEXIVE, PropertyCharacteristic.ASYMMETRIC}
+        ))
+        
+        prop = service.get_property("hasParent")
+        assert prop.property_type == PropertyType.OBJECT
+        assert prop.characteristics == {
+            PropertyCharacteristic.IRREFLEXIVE,
+            PropertyCharacteristic.ASYMMETRIC,
+        }
+    
+    def test_subproperty_closure(self, service):
+        """Test subPropertyOf edges are stored and walked transitively"""
+        service.create_property(OntologyProperty(
+            id="hasNickname", label="nickname", property_type=PropertyType.DATA,
+            parent_properties=["hasName"]
+        ))
+        service.create_properties_bulk([OntologyProperty(
+            id="hasPetName", label="pet name", property_type=PropertyType.DATA,
+            parent_properties=["hasNickname"]
+        )])
+        
+        assert service.get_property("hasPetName").parent_properties == ["hasNickname"]
+        assert [p.id for p in service.get_superproperties("hasPetName")] == ["hasNickname", "hasName"]
+        assert [p.id for p in service.get_subproperties("hasName")] == ["hasNickname", "hasPetName"]
+        assert [p.id for p in service.get_subproperties("hasName", direct_only=True)] == ["hasNickname"]
+    
+    def test_missing_parent_property_rejected(self, service):
+        """Test a parent property must exist"""
+        with pytest.raises(NodeNotFoundError):
+            service.create_property(OntologyProperty(
+                id="hasAlias", label="alias", property_type=PropertyType.DATA,
+                parent_properties=["hasNames"]
+            ))
+        assert not service.graph.node_exists("hasAlias")
+    
+    def test_unknown_characteristic_ignored(self, service):
+        """Test unrecognized characteristic strings are skipped"""
+        service.graph.add_node("legacy", data={
+            "label": "legacy",
+            "node_type": service.PROPERTY_TYPE,
+            "property_type": "data",
+            "characteristics": "functional,bogus",
+        })
+        
+        prop = service.get_property("legacy")
+        assert prop.characteristics == {PropertyCharacteristic.FUNCTIONAL}
+    
+    def test_unknown_property_type_reads_as_object(self, service):
+        """Test an unrecognized stored property type falls back to object"""
+        service.graph.add_node("legacy", data={
+            "label": "legacy",
+            "node_type": service.PROPERTY_TYPE,
+            "property_type": "relation",
+        })
+        
+        assert service.get_property("legacy").property_type == PropertyType.OBJECT
+
+
+class TestBulkCreation:
+    """Test batched creation matches one-at-a-time creation"""
+    
+    def test_bulk_matches_sequential(self, service):
+        """Test bulk-created classes, properties and instances read back the same"""
+        bulk = OntologyService()
+        bulk.create_classes_bulk([
+            OntologyClass(id="Animal", label="Animal", description="Any animal"),
+            OntologyClass(id="Mammal", label="Mammal", parent_classes=["Animal"]),
+            OntologyClass(id="Dog", label="Dog", parent_classes=["Mammal"]),
+            OntologyClass(id="Cat", label="Cat", parent_classes=["Mammal"]),
+        ])
+        bulk.create_properties_bulk([OntologyProperty(
+            id="hasName",
+            label="name",
+            property_type=PropertyType.DATA,
+            domain=["Animal"],
+            range=["string"]
+        )])
+        bulk.create_instances_bulk([
+            OntologyInstance(id="rex", label="Rex", class_ids=["Dog"]),
+            OntologyInstance(id="tom", label="Tom", class_ids=["Cat"]),
+        ])
+        
+        assert bulk.get_all_classes() == service.get_all_classes()
+        assert bulk.get_all_properties() == service.get_all_properties()
+        assert bulk.get_instance("rex") == service.get_instance("rex")
+        assert bulk.graph.get_stats() == service.graph.get_stats()
+        assert bulk.graph.get_neighbors("Mammal") == service.graph.get_neighbors("Mammal")
+    
+    def test_failed_batch_writes_nothing(self, service):
+        """Test a batch with a missing parent is rejected as a whole"""
+        nodes_before = service.graph.get_all_nodes()
+        
+        with pytest.raises(NodeNotFoundError):
+            service.create_classes_bulk([
+                OntologyClass(id="Bird", label="Bird", parent_classes=["Animal"]),
+                OntologyClass(id="Parrot", label="Parrot", parent_classes=["Birds"]),
+            ])
+        
+        assert service.graph.get_all_nodes() == nodes_before
+
+
+class TestInheritedProperties:
+    """Test property inheritance over the class lattice"""
+    
+    def test_diamond_lists_shared_property_once(self, service):
+        """Test a property reachable through two parents is inherited once, via the shorter path"""
+        service.create_class(OntologyClass(id="Pet", label="Pet", parent_classes=["Animal"]))
+        service.create_class(OntologyClass(id="Puppy", label="Puppy", parent_classes=["Dog", "Pet"]))
+        
+        inherited = service.compute_inherited_properties("Puppy")
+        assert [p['id'] for p in inherited] == ["hasName"]
+        assert inherited[0]['inheritance_path'] == ["Pet", "Animal"]
+    
+    def test_class_full_nearest_declaration_wins(self, service):
+        """Test a property declared on the class and an ancestor is listed once, as direct"""
+        service.create_property(OntologyProperty(
+            id="hasNickname",
+            label="nickname",
+            property_type=PropertyType.DATA,
+            domain=["Dog", "Animal"]
+        ))
+        
+        full = service.get_class_full("Dog")
+        assert [p['id'] for p in full['direct_properties']] == ["hasNickname"]
+        assert [p['id'] for p in full['inherited_properties']] == ["hasName"]
+        assert full['inherited_properties'][0]['source'] == "Animal"
+    
+    def test_results_are_copies(self, service):
+        """Test mutating a returned list doesn't leak into later calls"""
+        service.compute_inherited_properties("Dog")[0]['inheritance_path'].append("X")
+        
+        assert service.compute_inherited_properties("Dog")[0]['inheritance_path'] == ["Mammal", "Animal"]
+    
+    def test_cycle_terminates(self, service):
+        """Test inheritance over a subclass cycle still terminates"""
+        service.graph.add_edge("Animal", "Dog", label=service.SUBCLASS_RELATION)
+        service.refresh_indexes()
+        
+        assert [p['id'] for p in service.compute_inherited_properties("Dog")] == ["hasName"]
+
+
+class TestReasoning:
+    """Test consistency checking"""
+    
+    def test_consistent_hierarchy(self, service):
+        """Test an acyclic hierarchy is consistent"""
+        assert service.check_consistency().consistent
+    
+    def test_cycle_detected(self, service):
+        """Test a subclass cycle written to the graph is reported"""
+        service.graph.add_edge("Animal", "Dog", label=service.SUBCLASS_RELATION)
+        service.refresh_indexes()
+        
+        result = service.check_consistency()
+        assert not result.consistent
+        assert any("Animal" in error for error in result.errors)
+    
+    def test_one_error_per_cycle(self, service):
+        """Test each cycle is reported once, naming all its classes"""
+        service.graph.add_edge("Animal", "Dog", label=service.SUBCLASS_RELATION)
+        service.graph.add_edge("Cat", "Cat", label=service.SUBCLASS_RELATION)
+        service.refresh_indexes()
+        
+        errors = service.check_consistency().errors
+        assert sorted(errors) == [
+            "Circular inheritance detected involving 'Animal', 'Dog', 'Mammal'",
+            "Circular inheritance detected involving 'Cat'",
+        ]
+    
+    def test_statistics(self, service):
+        """Test counts and longest subclass chain"""
+        service.create_class(OntologyClass(id="Puppy", label="Puppy", parent_classes=["Dog", "Animal"]))
+        
+        stats = service.get_statistics()
+        assert stats.total_properties == 1
+        assert stats.total_data_properties == 1
+        assert stats.total_instances == 2
+        assert stats.max_hierarchy_depth == 4  # owl:Thing > Animal > Mammal > Dog > Puppy
+
+
+class TestMaterializedInferences:
+    """Test forward-chained subclass and type closures"""
+    
+    def test_closures_materialized(self, service):
+        """Test inferred superclasses and types, and entailed triples"""
+        result = service.materialize_inferences()
+        
+        assert result.consistent
+        assert result.subclass_closure["Dog"] == {"Mammal", "Animal", "owl:Thing"}
+        assert result.inferred_types["rex"] == ["Dog", "Mammal", "Animal", "owl:Thing"]
+        assert {"subject": "rex", "predicate": "rdf:type", "object": "Animal"} in result.inferred_relationships
+        assert {"subject": "Dog", "predicate": "rdfs:subClassOf", "object": "Mammal"} not in result.inferred_relationships
+    
+    def test_stale_after_mutation(self, service):
+        """Test reads fall back to live closures once the ontology changes"""
+        service.materialize_inferences()
+        assert not service.inferences_stale
+        assert [i.id for i in service.get_instances_of_class("Mammal", direct_only=False)] == ["rex", "tom"]
+        
+        service.create_instance(OntologyInstance(id="fido", label="Fido", class_ids=["Dog"]))
+        
+        assert service.inferences_stale
+        assert [i.id for i in service.get_instances_of_class("Mammal", direct_only=False)] == ["rex", "fido", "tom"]
+        assert service.get_class("Dog").parent_classes == ["Mammal"]
+    
+    def test_instance_typed_twice_listed_once(self, service):
+        """Test an instance of a class and its subclass appears once"""
+        service.create_instance(OntologyInstance(id="lassie", label="Lassie", class_ids=["Mammal", "Dog"]))
+        
+        for use_inference in (False, True):
+            if use_inference:
+                service.materialize_inferences()
+            ids = [i.id for i in service.get_instances_of_class(
+                "Animal", direct_only=False, use_inference=use_inference
+            )]
+            assert ids == ["lassie", "rex", "tom"]
+    
+    def test_run_racing_mutation_published_stale(self, service, monkeypatch):
+        """Test inferences computed across an invalidation are not served"""
+        find_cycles = service._find_cycles_scc
+        
+        def find_cycles_with_mutation():
+            service._invalidate_caches()
+            return find_cycles()
+        
+        monkeypatch.setattr(service, "_find_cycles_scc", find_cycles_with_mutation)
+        service.materialize_inferences()
+        
+        assert service.inferences_stale
+
+
+class TestSnapshot:
+    """Test read-only snapshots"""
+    
+    def test_reads_match_service(self, service):
+        """Test snapshot reads return what the service returns"""
+        snap = service.snapshot()
+        
+        assert snap.get_class("Dog") == service.get_class("Dog")
+        assert snap.get_subclasses("Animal") == service.get_subclasses("Animal")
+        assert snap.get_subclasses("Mammal", direct_only=True) == service.get_subclasses("Mammal", direct_only=True)
+        assert snap.get_superclasses("Dog") == service.get_superclasses("Dog")
+        assert snap.get_class_full("Dog") == service.get_class_full("Dog")
+        assert snap.instance_ids == {"rex", "tom"}
+        assert service.snapshot() is snap
+        
+        with pytest.raises(NodeNotFoundError):
+            snap.get_class("Horse")
+    
+    def test_unknown_class_relations_empty(self, service):
+        """Test relation reads for an unknown class return [] like the service"""
+        snap = service.snapshot()
+        
+        for direct_only in (True, False):
+            assert snap.get_superclasses("Horse", direct_only) == service.get_superclasses("Horse", direct_only) == []
+            assert snap.get_subclasses("Horse", direct_only) == service.get_subclasses("Horse", direct_only) == []
+    
+    def test_stale_after_mutation(self, service):
+        """Test a snapshot refuses reads once the ontology changes"""
+        snap = service.snapshot()
+        service.create_class(OntologyClass(id="Horse", label="Horse", parent_classes=["Mammal"]))
+        
+        assert not snap.is_current
+        with pytest.raises(InvalidOperationError):
+            snap.get_class("Dog")
+        assert service.snapshot().get_class("Horse").parent_classes == ["Mammal"]
+
+
+class TestDerivedDataCaching:
+    """Test memoized read results are dropped on mutation"""
+    
+    def test_class_full_reflects_new_property(self, service):
+        """Test get_class_full picks up a property added after a cached read"""
+        before = service.get_class_full("Dog")
+        assert service.get_class_full("Dog") is before
+        
+        service.create_property(OntologyProperty(
+            id="hasBreed",
+            label="breed",
+            property_type=PropertyType.DATA,
+            domain=["Dog"],
+            range=["string"]
+        ))
+        
+        after = service.get_class_full("Dog")
+        assert [p['id'] for p in after['direct_properties']] == ["hasBreed"]
+    
+    def test_deleted_class_not_served_from_cache(self, service):
+        """Test a memoized class is dropped when it is deleted"""
+        assert service.get_class("Dog") is service.get_class("Dog")
+        assert service.get_instance("rex") is service.get_instance("rex")
+        
+        service.delete_class("Dog", force=True)
+        
+        with pytest.raises(NodeNotFoundError):
+            service.get_class("Dog")
+        assert service.get_instance("rex").class_ids == []
+    
+    def test_hierarchy_reflects_new_class(self, service):
+        """Test get_class_hierarchy picks up a class added after a cached read"""
+        before = service.get_class_hierarchy("Mammal")
+        assert service.get_class_hierarchy("Mammal") is before
+        
+        service.create_class(OntologyClass(id="Horse", label="Horse", parent_classes=["Mammal"]))
+        
+        after = service.get_class_hierarchy("Mammal")
+        assert sorted(child.class_id for child in after.children) == ["Cat", "Dog", "Horse"]
+    
+    def test_fill_racing_mutation_not_memoized(self, service, monkeypatch):
+        """Test a result computed across an invalidation is not kept"""
+        walk = service._walk_class_properties
+        
+        def walk_with_mutation(class_id, visited):
+            result = walk(class_id, visited)
+            service._invalidate_caches()
+            return result
+        
+        monkeypatch.setattr(service, "_walk_class_properties", walk_with_mutation)
+        service.compute_inherited_properties("Dog")
+        
+        assert "Dog" not in service._inherited_props_cache
+    
+    def test_closure_racing_mutation_not_memoized(self, service, monkeypatch):
+        """Test a transitive closure computed across an invalidation is not kept"""
+        out_edges = service._out_edges
+        
+        def out_edges_with_mutation(label):
+            service._invalidate_caches()
+            return out_edges(label)
+        
+        monkeypatch.setattr(service, "_out_edges", out_edges_with_mutation)
+        reached = service._transitive_reachable("Dog", service.SUBCLASS_RELATION)
+        
+        assert "Animal" in reached
+        assert not service._closure_cache
+    
+    def test_class_read_racing_mutation_not_memoized(self, service, monkeypatch):
+        """Test a class read across an invalidation is not kept"""
+        get_node_data = service._get_node_data
+        
+        def get_node_data_with_mutation(node_id):
+            service._invalidate_caches()
+            return get_node_data(node_id)
+        
+        monkeypatch.setattr(service, "_get_node_data", get_node_data_with_mutation)
+        service.get_class("Dog")
+        
+        assert "Dog" not in service._class_cache
+
+
+class TestInstanceValidation:
+    """Test instance property validation"""
+    
+    def test_shared_property_checked_once(self, service, monkeypatch):
+        """Test a property required by several classes is reported once, others kept"""
+        name = {"id": "hasName", "label": "name", "source": "Animal"}
+        required = {
+            "Dog": [name, {"id": "hasBreed", "label": "breed", "source": "direct"}],
+            "Cat": [name],
+        }
+        monkeypatch.setattr(service, "_get_required_properties", required.__getitem__)
+        
+        assert service.validate_instance_properties_multi(["Dog", "Cat"], {}) == [
+            "Missing required property 'name' (inherited from Animal)",
+            "Missing required property 'breed'",
+        ]
+        assert service.validate_instance_properties_multi(["Cat", "Dog"], {"hasName": "Rex"}) == [
+            "Missing required property 'breed'",
+        ]
+    
+    def test_unreadable_class_skipped(self, service, monkeypatch):
+        """Test a failing class doesn't hide errors from the others"""
+        required = {"Dog": [{"id": "hasName", "label": "name", "source": "Animal"}]}
+        
+        def get_required_properties(class_id):
+            if class_id not in required:
+                raise NodeNotFoundError(f"Class '{class_id}' not found")
+            return required[class_id]
+        
+        monkeypatch.setattr(service, "_get_required_properties", get_required_properties)
+        errors = service.validate_instance_properties_multi(["Ghost", "Dog"], {})
+        
+        assert errors == ["Missing required property 'name' (inherited from Animal)"]
+
+
+class TestConcurrency:
+    """Test reads that walk the indexes while another thread writes"""
+    
+    def test_index_walks_during_writes(self, service):
+        """Test consistency, inferences and statistics don't see a half-done write"""
+        errors = []
+        done = threading.Event()
+        
+        def write():
+            for i in range(300):
+                service.create_class(OntologyClass(id=f"C{i}", label=f"C{i}", parent_classes=["Mammal"]))
+                service.create_instance(OntologyInstance(id=f"i{i}", label=f"i{i}", class_ids=[f"C{i}"]))
+            done.set()
+        
+        def read(query):
+            while not done.is_set():
+                try:
+                    query()
+                except Exception as e:
+                    errors.append(e)
+                    return
+        
+        threads = [threading.Thread(target=write)] + [
+            threading.Thread(target=read, args=(query,))
+            for query in (service.check_consistency, service.materialize_inferences, service.get_statistics)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
+        assert service.get_statistics().total_classes == 305